@@ -11,9 +11,18 @@ __version__ = "1.0.0"
 __author__ = "Claude Code"
 __description__ = "Automated Minecraft plugin update manager"
 
-from .updater import MinecraftPluginUpdater
 from .config import MANAGED_PLUGINS, SERVERS
 
+
+def __getattr__(name):
+    # Import the updater (and requests with it) only when it's actually used,
+    # so `minecraft-plugin-manager --version`/`--help` start quickly
+    if name == "MinecraftPluginUpdater":
+        from .updater import MinecraftPluginUpdater
+        return MinecraftPluginUpdater
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "MinecraftPluginUpdater",
     "MANAGED_PLUGINS",
@@ -4,18 +4,105 @@ API Clients for Plugin Sources
 Handles communication with Modrinth and Geyser APIs.
 """
 
+import atexit
+import functools
 import hashlib
+import hmac
+import json
 import logging
+import mmap
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import blake3  # Optional: pip install minecraft-plugin-manager[blake3]
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson  # Optional: pip install minecraft-plugin-manager[orjson]
+except ImportError:
+    orjson = None
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .config import MODRINTH_API, GEYSER_API, DOWNLOADS_DIR
+from . import __version__
+from .config import MODRINTH_API, GEYSER_API, DOWNLOADS_DIR, CACHE_DIR
 
 logger = logging.getLogger(__name__)
 
+# JSON decoder for API responses (orjson if installed)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Hash algorithms to verify with, fastest first (blake3 only if installed)
+HASH_PREFERENCE = (("blake3",) if blake3 is not None else ()) + ("sha256", "sha512", "sha1")
+
+# Read buffer for hashing files that can't be memory-mapped (e.g. empty files)
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Streaming chunk size for JAR downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Concurrent metadata requests when checking for updates
+CHECK_MAX_WORKERS = 8
+
+# Modrinth loader tags whose plugins run on each platform (Paper runs Spigot/Bukkit
+# plugins; Folia/Purpur-only builds may rely on APIs Paper lacks, so they're excluded)
+COMPATIBLE_LOADERS = {
+    "paper": ("paper", "spigot", "bukkit"),
+    "spigot": ("spigot", "bukkit"),
+    "velocity": ("velocity",),
+}
+
+# Keep-alive connections kept per host by the shared session. Must cover the busiest
+# concurrent use (update checks, plus downloads from the same CDN) or extra
+# connections are opened and thrown away after each request.
+HTTP_POOL_MAXSIZE = max(16, CHECK_MAX_WORKERS)
+
+# Geyser-style build suffix, e.g. '2.9.0-build981'
+_BUILD_RE = re.compile(r'-build(\d+)')
+
+# On-disk cache of Modrinth version listings (revalidated with ETag)
+MODRINTH_CACHE_DIR = CACHE_DIR / "modrinth"
+
+# File hashes from earlier runs, keyed by path and hash type and valid while size/mtime match
+HASH_CACHE_FILE = CACHE_DIR / "hashes.json"
+
+
+def _create_session() -> requests.Session:
+    """Create the shared HTTP session (keep-alive pool + retries on transient errors)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Modrinth asks API clients to identify themselves
+    session.headers.update({
+        "User-Agent": f"minecraft-plugin-manager/{__version__}",
+    })
+    return session
+
+
+# Shared across all API clients and downloads so connections are reused
+_SESSION = _create_session()
+
 
 class ModrinthAPIClient:
     """Client for Modrinth API"""
@@ -27,12 +114,17 @@ class ModrinthAPIClient:
         """
         self.force_snapshots = force_snapshots
 
-    def check_updates(self, project_id: str) -> Optional[Dict]:
+    def check_updates(self, project_id: str, loaders: Optional[List[str]] = None,
+                      game_versions: Optional[List[str]] = None) -> Optional[Dict]:
         """
         Check for updates from Modrinth API
 
         Args:
             project_id: Modrinth project identifier
+            loaders: Only consider versions for these platforms, e.g. ["paper"], each
+                expanded to its COMPATIBLE_LOADERS (ignored when forcing)
+            game_versions: Only consider versions for these Minecraft versions
+                (ignored when forcing)
 
         Returns:
             Dict with version info, or None if error
@@ -41,10 +133,39 @@ class ModrinthAPIClient:
             url = f"{MODRINTH_API}/project/{project_id}/version"
             logger.info(f"Checking Modrinth for updates: {project_id}")
 
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            # Narrow the listing server-side; changelogs are the bulk of the payload.
+            # --force bypasses the loader/game version filter as well as the cache.
+            params = {"include_changelog": "false"}
+            if loaders:
+                loaders = sorted({loader for platform in loaders
+                                  for loader in COMPATIBLE_LOADERS.get(platform, (platform,))})
+            if loaders and not self.force_snapshots:
+                params["loaders"] = json.dumps(loaders)
+            if game_versions and not self.force_snapshots:
+                params["game_versions"] = json.dumps(sorted(game_versions))
+
+            # Revalidate cached listing instead of re-downloading it (--force bypasses cache)
+            use_cache = not self.force_snapshots
+            cache_key = "_".join([project_id] + (loaders or []) + sorted(game_versions or []))
+            cached = self._load_cache(cache_key) if use_cache else None
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            response = _SESSION.get(url, params=params, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cached:
+                logger.debug(f"Modrinth listing unchanged for {project_id} (cached)")
+                versions = cached["body"]
+            else:
+                response.raise_for_status()
+                versions = _loads(response.content)
+                if use_cache:
+                    self._save_cache(cache_key, response, versions)
 
-            versions = response.json()
             if not versions:
                 logger.warning(f"No versions found for {project_id}")
                 return None
@@ -63,9 +184,9 @@ class ModrinthAPIClient:
             file_info = latest["files"][0]
             hashes = file_info.get("hashes", {})
 
-            # Modrinth may provide sha1 or sha512, not always sha256
-            hash_value = hashes.get("sha256") or hashes.get("sha512") or hashes.get("sha1")
-            hash_type = "sha256" if "sha256" in hashes else ("sha512" if "sha512" in hashes else "sha1")
+            # Modrinth may provide sha1 or sha512, not always sha256; prefer the fastest
+            hash_type = next((h for h in HASH_PREFERENCE if hashes.get(h)), "sha1")
+            hash_value = hashes.get(hash_type)
 
             return {
                 "version": latest["version_number"],
@@ -77,10 +198,44 @@ class ModrinthAPIClient:
                 "game_versions": latest["game_versions"]
             }
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON body
             logger.error(f"Failed to check Modrinth for {project_id}: {e}")
             return None
 
+    @staticmethod
+    def _load_cache(cache_key: str) -> Optional[Dict]:
+        """Load cached version listing, or None if missing/corrupt"""
+        cache_file = MODRINTH_CACHE_DIR / f"{cache_key}.json"
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save_cache(cache_key: str, response: requests.Response, versions: list):
+        """Store version listing with its validators (only if the server sent any)"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": versions
+        }
+
+        try:
+            MODRINTH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write then rename: cache entries may be written from concurrent checks
+            with tempfile.NamedTemporaryFile('w', dir=MODRINTH_CACHE_DIR, suffix=".tmp",
+                                             delete=False) as f:
+                json.dump(entry, f)
+            os.replace(f.name, MODRINTH_CACHE_DIR / f"{cache_key}.json")
+        except OSError as e:
+            logger.debug(f"Could not write Modrinth cache for {cache_key}: {e}")
+
 
 class GeyserAPIClient:
     """Client for Geyser Download API"""
@@ -102,10 +257,10 @@ class GeyserAPIClient:
             url = f"{GEYSER_API}/{project}/versions/latest/builds/latest"
             logger.info(f"Checking Geyser API for updates: {project}/{artifact}")
 
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             version = data["version"]
             build = data["build"]
 
@@ -120,16 +275,76 @@ class GeyserAPIClient:
                 "release_date": data.get("time", "")
             }
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON body
             logger.error(f"Failed to check Geyser API for {project}/{artifact}: {e}")
             return None
 
 
+def check_updates_batch(specs: Dict[str, Dict], modrinth_client: ModrinthAPIClient,
+                        geyser_client: GeyserAPIClient) -> Dict[str, Optional[Dict]]:
+    """
+    Check several plugins for updates concurrently
+
+    Args:
+        specs: Dict of {plugin_name: plugin_config} (source, project_id, ...)
+        modrinth_client: Client used for modrinth sources
+        geyser_client: Client used for geyser sources
+
+    Returns:
+        Dict of {plugin_name: version info or None}; unknown sources are omitted
+    """
+    results = {}
+    if not specs:
+        return results
+
+    # No more threads than there are plugins to check
+    with ThreadPoolExecutor(max_workers=min(CHECK_MAX_WORKERS, len(specs))) as executor:
+        futures = {}
+        for plugin_name, config in specs.items():
+            if config["source"] == "modrinth":
+                future = executor.submit(modrinth_client.check_updates, config["project_id"],
+                                         config.get("platforms"), config.get("game_versions"))
+            elif config["source"] == "geyser":
+                future = executor.submit(geyser_client.check_updates,
+                                         config["project"], config["artifact"])
+            else:
+                continue
+            futures[future] = plugin_name
+
+        for future in as_completed(futures):
+            plugin_name = futures[future]
+            try:
+                results[plugin_name] = future.result()
+            except Exception as e:
+                logger.error(f"Update check failed for {plugin_name}: {e}")
+                results[plugin_name] = None
+
+    return results
+
+
 class PluginDownloader:
     """Handles plugin download and verification"""
 
-    def __init__(self, dry_run: bool = False):
+    # Set once DOWNLOADS_DIR has been created (shared by all instances)
+    _dir_ready = False
+
+    # {"<path>|<hash_type>": [size, mtime_ns, hexdigest]}, loaded from HASH_CACHE_FILE on first use
+    _hash_cache: Optional[Dict[str, list]] = None
+    _hash_cache_dirty = False
+    _hash_cache_lock = threading.Lock()
+
+    def __init__(self, dry_run: bool = False, force: bool = False):
+        """
+        Args:
+            dry_run: Preview mode - no actual downloads
+            force: Re-download even if a verified copy is already on disk
+        """
         self.dry_run = dry_run
+        self.force = force
+
+        # SHA256 of every file this downloader produced or verified, so callers
+        # (e.g. deployment state) don't need to hash the JAR again
+        self.sha256_by_path: Dict[Path, str] = {}
 
     def download(self, download_url: str, filename: str, expected_hash: Optional[str] = None,
                  hash_type: str = "sha256") -> Optional[Path]:
@@ -140,13 +355,12 @@ class PluginDownloader:
             download_url: URL to download from
             filename: Filename to save as
             expected_hash: Expected hash value for verification
-            hash_type: Hash algorithm (sha256, sha512, sha1)
+            hash_type: Hash algorithm (blake3, sha256, sha512, sha1)
 
         Returns:
             Path to downloaded file, or None if failed
         """
-        # Ensure downloads directory exists
-        DOWNLOADS_DIR.mkdir(exist_ok=True)
+        self._ensure_downloads_dir()
 
         download_path = DOWNLOADS_DIR / filename
 
@@ -154,42 +368,118 @@ class PluginDownloader:
             logger.info(f"[DRY RUN] Would download: {download_url} → {download_path}")
             return download_path
 
+        # Reuse a verified copy left by a previous (possibly interrupted) run
+        if expected_hash and not self.force and download_path.exists():
+            if self.calculate_hash(download_path, hash_type) == expected_hash:
+                logger.info(f"  ✓ Using cached download: {download_path}")
+                if self._normalize_hash_type(hash_type) == "sha256":
+                    self.sha256_by_path[download_path] = expected_hash
+                return download_path
+
         logger.info(f"Downloading: {filename}")
         logger.info(f"  URL: {download_url}")
 
         try:
-            response = requests.get(download_url, stream=True, timeout=30)
+            response = _SESSION.get(download_url, stream=True, timeout=30)
             response.raise_for_status()
 
+            # Hash while writing so the file isn't re-read for verification
+            # (SHA256 is always kept as well, for the deployment state record)
+            hash_type = self._normalize_hash_type(hash_type)
+            hash_objs = {"sha256": hashlib.sha256()}
+            if expected_hash and hash_type not in hash_objs:
+                hash_objs[hash_type] = self._new_hash(hash_type)
+            hash_obj = hash_objs[hash_type] if expected_hash else None
+            hash_updates = [h.update for h in hash_objs.values()]
+
             with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                self._bypass_page_cache(f)
+                # Read the raw stream directly rather than through iter_content's generator
+                response.raw.decode_content = True
+                for chunk in iter(lambda: response.raw.read(DOWNLOAD_CHUNK_SIZE), b""):
                     f.write(chunk)
+                    for update in hash_updates:
+                        update(chunk)
+                self._release_page_cache(f)
 
             # Verify download
             file_size = download_path.stat().st_size
             logger.info(f"  Downloaded: {file_size:,} bytes")
 
-            # Calculate and verify hash if available
+            # Verify hash if available
             if expected_hash:
-                calculated_hash = self.calculate_hash(download_path, hash_type)
-
-                if calculated_hash == expected_hash:
-                    logger.info(f"  ✓ {hash_type.upper()} verified: {calculated_hash[:16]}...")
+                if self._digest_matches(hash_obj.digest(), expected_hash):
+                    logger.info(f"  ✓ {hash_type.upper()} verified: {expected_hash[:16]}...")
                 else:
                     logger.error(f"  ✗ {hash_type.upper()} mismatch!")
                     logger.error(f"    Expected: {expected_hash}")
-                    logger.error(f"    Got:      {calculated_hash}")
+                    logger.error(f"    Got:      {hash_obj.hexdigest()}")
                     download_path.unlink()  # Delete corrupted file
                     return None
 
+            self.sha256_by_path[download_path] = hash_objs["sha256"].hexdigest()
+            self._remember_hashes(download_path,
+                                  {name: h.hexdigest() for name, h in hash_objs.items()})
             return download_path
 
-        except requests.RequestException as e:
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
             logger.error(f"Download failed for {filename}: {e}")
             if download_path.exists():
                 download_path.unlink()
             return None
 
+    @classmethod
+    def _ensure_downloads_dir(cls):
+        """Ensure downloads directory exists (only hits the filesystem once)"""
+        if not cls._dir_ready:
+            DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
+            cls._dir_ready = True
+
+    @staticmethod
+    def _bypass_page_cache(f):
+        """Ask macOS not to cache writes to this file (no-op elsewhere)"""
+        if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+            try:
+                fcntl.fcntl(f.fileno(), fcntl.F_NOCACHE, 1)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _release_page_cache(f):
+        """Drop a finished download from the Linux page cache (best effort)"""
+        if hasattr(os, "posix_fadvise"):
+            try:
+                # DONTNEED only evicts clean pages, so write the data back first
+                f.flush()
+                os.fdatasync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _digest_matches(digest: bytes, expected_hash: str) -> bool:
+        """Compare a raw digest against an expected hex string (constant time)"""
+        try:
+            expected_bytes = bytes.fromhex(expected_hash)
+        except ValueError:
+            return False
+        return hmac.compare_digest(digest, expected_bytes)
+
+    @staticmethod
+    def _normalize_hash_type(hash_type: str) -> str:
+        """Map a hash name to a supported algorithm (sha256 if unknown)"""
+        hash_type = hash_type.lower()
+        if hash_type not in HASH_PREFERENCE:
+            return "sha256"
+        return hash_type
+
+    @staticmethod
+    def _new_hash(hash_type: str):
+        """Create a hash object for a normalized hash type"""
+        if hash_type == "blake3":
+            return blake3.blake3()
+        return hashlib.new(hash_type)
+
     @staticmethod
     def calculate_hash(filepath: Path, hash_type: str = "sha256") -> str:
         """
@@ -197,24 +487,152 @@ class PluginDownloader:
 
         Args:
             filepath: Path to file
-            hash_type: Hash algorithm (sha256, sha512, sha1)
+            hash_type: Hash algorithm (blake3, sha256, sha512, sha1)
 
         Returns:
             Hexadecimal hash string
         """
-        if hash_type == "sha1":
-            hash_obj = hashlib.sha1()
-        elif hash_type == "sha512":
-            hash_obj = hashlib.sha512()
-        else:
-            hash_obj = hashlib.sha256()
+        hash_type = PluginDownloader._normalize_hash_type(hash_type)
+
+        # Unchanged since it was last hashed (same size and mtime)? Skip the read.
+        cached = PluginDownloader._cached_hash(filepath, hash_type)
+        if cached is not None:
+            return cached
+
+        hash_obj = PluginDownloader._new_hash(hash_type)
+        with open(filepath, "rb") as f:
+            PluginDownloader._update_from_file(f, [hash_obj])
+        digest = hash_obj.hexdigest()
+
+        PluginDownloader._remember_hashes(filepath, {hash_type: digest})
+        return digest
+
+    @classmethod
+    def _hash_cache_entries(cls) -> Dict[str, list]:
+        """Persistent hash cache, loaded on first use (call with _hash_cache_lock held)"""
+        if cls._hash_cache is None:
+            try:
+                entries = _loads(HASH_CACHE_FILE.read_bytes())
+            except (OSError, ValueError):
+                entries = {}
+
+            # Forget files that have been deleted since the cache was written
+            cls._hash_cache = {key: entry for key, entry in entries.items()
+                               if os.path.exists(key.rpartition("|")[0])}
+            cls._hash_cache_dirty = len(cls._hash_cache) != len(entries)
+        return cls._hash_cache
+
+    @classmethod
+    def _cached_hash(cls, filepath: Path, hash_type: str) -> Optional[str]:
+        """Hash recorded for filepath if the file's size and mtime still match, else None"""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+
+        with cls._hash_cache_lock:
+            entry = cls._hash_cache_entries().get(f"{Path(filepath).resolve()}|{hash_type}")
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    @classmethod
+    def _remember_hashes(cls, filepath: Path, digests: Dict[str, str]):
+        """
+        Record hashes of filepath in the persistent cache (written by save_hash_cache())
+
+        Args:
+            filepath: File that was hashed
+            digests: Dict of {hash_type: hexadecimal hash string}
+        """
+        try:
+            stat = os.stat(filepath)
+            path = Path(filepath).resolve()
+        except OSError:
+            return
+
+        with cls._hash_cache_lock:
+            entries = cls._hash_cache_entries()
+            for hash_type, digest in digests.items():
+                entries[f"{path}|{hash_type}"] = [stat.st_size, stat.st_mtime_ns, digest]
+            cls._hash_cache_dirty = True
+
+    @classmethod
+    def save_hash_cache(cls):
+        """Write the persistent hash cache if it changed (also runs at interpreter exit)"""
+        with cls._hash_cache_lock:
+            if not cls._hash_cache_dirty:
+                return
+
+            tmp_name = None
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', dir=CACHE_DIR, suffix=".tmp",
+                                                 delete=False) as f:
+                    tmp_name = f.name
+                    json.dump(cls._hash_cache, f)
+                os.replace(tmp_name, HASH_CACHE_FILE)
+                tmp_name = None
+                cls._hash_cache_dirty = False
+            except OSError as e:
+                logger.debug(f"Could not write hash cache: {e}")
+            finally:
+                if tmp_name is not None:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def calculate_hashes(filepath: Path, hash_types: List[str]) -> Dict[str, str]:
+        """
+        Calculate several hashes of a file in a single read pass
+
+        Args:
+            filepath: Path to file
+            hash_types: Hash algorithms (blake3, sha256, sha512, sha1)
+
+        Returns:
+            Dict of {hash_type: hexadecimal hash string}
+        """
+        hash_objs = {}
+        for hash_type in hash_types:
+            hash_type = PluginDownloader._normalize_hash_type(hash_type)
+            hash_objs[hash_type] = PluginDownloader._new_hash(hash_type)
 
         with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(65536), b""):
+            PluginDownloader._update_from_file(f, list(hash_objs.values()))
+
+        return {hash_type: hash_obj.hexdigest() for hash_type, hash_obj in hash_objs.items()}
+
+    @staticmethod
+    def _update_from_file(f, hash_objs: list):
+        """
+        Feed a whole file to each hash object
+
+        The file is memory-mapped so each hash consumes it in one C-level update
+        (no per-chunk Python loop or copies); falls back to chunked reads where
+        mmap isn't possible, such as empty files.
+
+        Args:
+            f: File opened in binary mode
+            hash_objs: Hash objects to update
+        """
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for hash_obj in hash_objs:
+                    hash_obj.update(mm)
+            return
+        except (ValueError, OSError):
+            pass
+
+        f.seek(0)
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            for hash_obj in hash_objs:
                 hash_obj.update(byte_block)
-        return hash_obj.hexdigest()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def normalize_version(version: str) -> str:
         """
         Normalize version strings for comparison (e.g., 'build981' → 'b981')
@@ -226,5 +644,9 @@ class PluginDownloader:
             Normalized version string
         """
         # Replace 'build' with 'b' for consistency
-        normalized = re.sub(r'-build(\d+)', r'-b\1', version)
+        normalized = _BUILD_RE.sub(r'-b\1', version)
         return normalized
+
+
+# Persist hashes recorded by any downloader (e.g. from update_deployment_state)
+atexit.register(PluginDownloader.save_hash_cache)
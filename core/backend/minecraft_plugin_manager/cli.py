@@ -5,38 +5,65 @@ Entry point for minecraft-plugin-manager CLI tool.
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from . import __version__
-from .updater import MinecraftPluginUpdater
-from .deployment import DeploymentManager
-from .config import BASE_DIR
-from .config_loader import load_config, validate_config, save_config
-from .pterodactyl import PterodactylClient
+from .config import BASE_DIR, MANAGED_PLUGINS
+
+if TYPE_CHECKING:
+    from .updater import MinecraftPluginUpdater
+
+logger = logging.getLogger(__name__)
+
 
 # Logging setup
 def setup_logging():
-    """Configure logging for CLI"""
+    """
+    Configure logging for CLI
+
+    File writes go through a queue and a background listener thread so
+    concurrent download/check workers don't contend on the file handler.
+    Console output stays synchronous to keep it ordered with input() prompts.
+    Safe to call more than once; only the first call configures handlers.
+    """
+    if logging.getLogger().handlers:
+        return logger
+
     log_file = BASE_DIR / f"minecraft-plugin-manager-{datetime.now().strftime('%Y%m%d%H%M%S')}.log"
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    # delay=True: the log file is only created once something is logged
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # file_handler adds the prefix
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
 
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
+            queue_handler,
+            stream_handler
         ]
     )
-    return logging.getLogger(__name__)
-
 
-logger = setup_logging()
+    listener.start()
+    atexit.register(listener.stop)
+    return logger
 
 
-def run_update_workflow(updater: MinecraftPluginUpdater, check_only: bool = False,
+def run_update_workflow(updater: "MinecraftPluginUpdater", check_only: bool = False,
                         download_only: bool = False, deploy: bool = False) -> int:
     """
     Main update workflow execution
@@ -50,12 +77,14 @@ def run_update_workflow(updater: MinecraftPluginUpdater, check_only: bool = Fals
     Returns:
         Exit code (0 = success)
     """
-    logger.info("Minecraft Plugin Manager")
-    logger.info("=" * 70)
-    logger.info(f"Version: {__version__}")
-    logger.info(f"Mode: {'DRY RUN' if updater.dry_run else 'LIVE'}")
-    logger.info(f"Force: {updater.force}")
-    logger.info("")
+    logger.info("\n".join([
+        "Minecraft Plugin Manager",
+        "=" * 70,
+        f"Version: {__version__}",
+        f"Mode: {'DRY RUN' if updater.dry_run else 'LIVE'}",
+        f"Force: {updater.force}",
+        "",
+    ]))
 
     # Step 1: Check for updates
     updates = updater.check_for_updates()
@@ -76,7 +105,9 @@ def run_update_workflow(updater: MinecraftPluginUpdater, check_only: bool = Fals
             logger.info("\nRun with --download to download updates")
         return 0
 
-    # Step 2: Download updates
+    # Step 2: Download updates (deploy checks run over SSH meanwhile)
+    if deploy:
+        updater.start_deployment_checks(list(updates))
     downloads = updater.download_all_updates(updates)
 
     if len(downloads) != len(updates):
@@ -114,10 +145,14 @@ def run_init_wizard() -> int:
     Returns:
         Exit code (0 = success)
     """
-    logger.info("=" * 70)
-    logger.info("Minecraft Plugin Manager - Setup Wizard")
-    logger.info("=" * 70)
-    logger.info("\nThis wizard will help you create a configuration file.\n")
+    from .config_loader import save_config
+
+    logger.info("\n".join([
+        "=" * 70,
+        "Minecraft Plugin Manager - Setup Wizard",
+        "=" * 70,
+        "\nThis wizard will help you create a configuration file.\n",
+    ]))
 
     config = {}
 
@@ -127,6 +162,8 @@ def run_init_wizard() -> int:
     panel_url = input("Panel URL (e.g., https://panel.example.com): ").strip()
 
     if panel_url:
+        from .pterodactyl import PterodactylClient
+
         api_key = input("API Key (ptlc_ or ptla_ prefix): ").strip()
 
         if not api_key:
@@ -180,7 +217,6 @@ def run_init_wizard() -> int:
         config['servers'] = {}
 
     # Set managed plugins to defaults
-    from .config import MANAGED_PLUGINS
     config['managed_plugins'] = MANAGED_PLUGINS
 
     # Ask where to save config
@@ -213,9 +249,13 @@ def run_discovery(config: dict = None) -> int:
     Returns:
         Exit code (0 = success)
     """
-    logger.info("=" * 70)
-    logger.info("Minecraft Plugin Manager - Server Discovery")
-    logger.info("=" * 70)
+    from .config_loader import get_config_paths, load_config, save_config
+
+    logger.info("\n".join([
+        "=" * 70,
+        "Minecraft Plugin Manager - Server Discovery",
+        "=" * 70,
+    ]))
 
     # Load config if not provided
     if not config:
@@ -236,6 +276,8 @@ def run_discovery(config: dict = None) -> int:
     # Run discovery
     try:
         logger.info("\nConnecting to Pterodactyl panel...")
+        from .pterodactyl import PterodactylClient
+
         client = PterodactylClient(ptero_config['panel_url'], ptero_config['api_key'])
 
         # Get discovery settings
@@ -273,7 +315,6 @@ def run_discovery(config: dict = None) -> int:
             config['servers'] = discovered
 
             # Determine config file path
-            from .config_loader import get_config_paths
             config_paths = get_config_paths()
             config_file = None
             for path in config_paths:
@@ -304,6 +345,126 @@ def run_discovery(config: dict = None) -> int:
         return 1
 
 
+def _load_validated_config(args: argparse.Namespace) -> Optional[dict]:
+    """
+    Load and validate configuration for commands that need it
+
+    Returns:
+        Config dict, or None if validation failed (errors already logged)
+    """
+    from .config_loader import load_config, validate_config
+
+    config = load_config(args.config if args.config else None)
+
+    is_valid, errors = validate_config(config)
+    if not is_valid:
+        logger.error("\n✗ Configuration validation failed:")
+        for error in errors:
+            logger.error(f"  - {error}")
+        logger.info("\nRun 'minecraft-plugin-manager --init' to create a valid configuration")
+        return None
+
+    return config
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for a count that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _create_updater(args: argparse.Namespace, config: dict) -> "MinecraftPluginUpdater":
+    """Create updater instance with config"""
+    from .updater import MinecraftPluginUpdater
+
+    return MinecraftPluginUpdater(dry_run=args.dry_run, force=args.force, config=config,
+                                  jobs=args.jobs)
+
+
+def _run_rollback(args: argparse.Namespace) -> int:
+    """Handle --rollback mode"""
+    if _load_validated_config(args) is None:
+        return 1
+
+    from .deployment import DeploymentManager
+
+    with DeploymentManager(dry_run=args.dry_run) as deployer:
+        if deployer.rollback_deployment():
+            logger.info("\n✓ Rollback completed successfully")
+            return 0
+        else:
+            logger.error("\n✗ Rollback failed")
+            return 1
+
+
+def _run_audit(args: argparse.Namespace) -> int:
+    """Handle --audit mode"""
+    config = _load_validated_config(args)
+    if config is None:
+        return 1
+
+    inconsistencies = _create_updater(args, config).check_version_consistency()
+
+    if not inconsistencies:
+        logger.info("\n✓ All servers have consistent plugin versions!")
+        return 0
+    else:
+        logger.error(f"\n✗ Found {len(inconsistencies)} plugin(s) with version inconsistencies")
+        logger.info("\nRecommendation: Use --download and --deploy to sync versions across servers")
+        return 1
+
+
+def _run_status(args: argparse.Namespace) -> int:
+    """Handle --status mode"""
+    config = _load_validated_config(args)
+    if config is None:
+        return 1
+
+    _create_updater(args, config).show_status()
+    return 0
+
+
+def _run_update(args: argparse.Namespace) -> int:
+    """Handle update workflow (check, download, deploy)"""
+    config = _load_validated_config(args)
+    if config is None:
+        return 1
+
+    check_only = args.check and not args.download and not args.deploy
+    download_only = args.download and not args.deploy
+    deploy = args.deploy
+
+    # Closing the updater ends the SSH master connection instead of leaving it to ControlPersist
+    with _create_updater(args, config) as updater:
+        return run_update_workflow(updater, check_only=check_only,
+                                   download_only=download_only, deploy=deploy)
+
+
+def _no_action_specified(args: argparse.Namespace) -> bool:
+    """True if none of the action flags were given"""
+    return not (args.init or args.discover or args.check or args.download or args.deploy
+                or args.rollback or args.audit or args.status)
+
+
+# Action flags in the order they take precedence
+_COMMAND_PRIORITY = (
+    "init", "discover", "rollback", "audit", "status", "deploy", "download", "check",
+)
+
+_COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "init": lambda args: run_init_wizard(),
+    "discover": lambda args: run_discovery(),
+    "rollback": _run_rollback,
+    "audit": _run_audit,
+    "status": _run_status,
+    "deploy": _run_update,
+    "download": _run_update,
+    "check": _run_update,
+}
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -354,6 +515,8 @@ Documentation:
     parser.add_argument("--force", action="store_true", help="Force update even if versions match (includes SNAPSHOT versions)")
     parser.add_argument("--dry-run", action="store_true", help="Dry run mode (preview changes without executing)")
     parser.add_argument("--status", action="store_true", help="Show current plugin versions")
+    parser.add_argument("--jobs", type=_positive_int, metavar="N",
+                        help="Max servers to deploy/restart/verify in parallel (default: 8)")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
 
     # Config file override
@@ -361,68 +524,21 @@ Documentation:
 
     args = parser.parse_args()
 
+    # Configure logging only once we know we're running a command (argparse has
+    # already exited for --help/--version and usage errors)
+    setup_logging()
+
     # Default to check mode if no action specified
-    if not any([args.init, args.discover, args.check, args.download, args.deploy, args.rollback, args.audit, args.status]):
+    if _no_action_specified(args):
         args.check = True
         args.dry_run = True
 
-    try:
-        # Handle --init mode (setup wizard)
-        if args.init:
-            return run_init_wizard()
-
-        # Handle --discover mode (Pterodactyl discovery)
-        if args.discover:
-            return run_discovery()
-
-        # Load configuration
-        config = load_config(args.config if args.config else None)
-
-        # Validate configuration
-        is_valid, errors = validate_config(config)
-        if not is_valid:
-            logger.error("\n✗ Configuration validation failed:")
-            for error in errors:
-                logger.error(f"  - {error}")
-            logger.info("\nRun 'minecraft-plugin-manager --init' to create a valid configuration")
-            return 1
-
-        # Handle --rollback mode
-        if args.rollback:
-            deployer = DeploymentManager(dry_run=args.dry_run)
-            if deployer.rollback_deployment():
-                logger.info("\n✓ Rollback completed successfully")
-                return 0
-            else:
-                logger.error("\n✗ Rollback failed")
-                return 1
-
-        # Create updater instance with config
-        updater = MinecraftPluginUpdater(dry_run=args.dry_run, force=args.force, config=config)
+    # Highest-priority action flag wins (flags like --check --download combine
+    # into the update workflow, so this is a precedence order, not exclusivity)
+    command = next(name for name in _COMMAND_PRIORITY if getattr(args, name))
 
-        # Handle --audit mode
-        if args.audit:
-            inconsistencies = updater.check_version_consistency()
-
-            if not inconsistencies:
-                logger.info("\n✓ All servers have consistent plugin versions!")
-                return 0
-            else:
-                logger.error(f"\n✗ Found {len(inconsistencies)} plugin(s) with version inconsistencies")
-                logger.info("\nRecommendation: Use --download and --deploy to sync versions across servers")
-                return 1
-
-        # Handle --status mode
-        if args.status:
-            updater.show_status()
-            return 0
-
-        # Handle update workflow (check, download, deploy)
-        check_only = args.check and not args.download and not args.deploy
-        download_only = args.download and not args.deploy
-        deploy = args.deploy
-
-        return run_update_workflow(updater, check_only=check_only, download_only=download_only, deploy=deploy)
+    try:
+        return _COMMANDS[command](args)
 
     except KeyboardInterrupt:
         logger.info("\n\nInterrupted by user")
@@ -5,14 +5,26 @@ Defines all plugins, servers, and infrastructure settings.
 """
 
 from pathlib import Path
+from types import MappingProxyType
+
+
+def _freeze(value):
+    """Recursively make default config read-only (dicts → MappingProxyType, lists → tuples)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 # Base directory - resolve to minecraft/ directory (3 levels up from this file)
 # projects/minecraft-plugin-manager/core/backend/minecraft_plugin_manager/config.py
 # ../../../../../../minecraft/
-BASE_DIR = Path(__file__).parent.parent.parent.parent.parent.parent / "minecraft"
+BASE_DIR = Path(__file__).parents[5] / "minecraft"
 SHARED_PLUGINS_DIR = BASE_DIR / "shared-plugins"
 DOWNLOADS_DIR = BASE_DIR / "downloads"
 CHECKSUMS_DIR = BASE_DIR / "checksums"
+CACHE_DIR = BASE_DIR / ".cache"
 MANIFEST_FILE = SHARED_PLUGINS_DIR / "shared-plugins.json"
 DEPLOYMENT_STATE_FILE = CHECKSUMS_DIR / "deployment-state.json"
 
@@ -45,6 +57,7 @@ COMPATIBILITY_MATRIX = {
         }
     }
 }
+COMPATIBILITY_MATRIX = _freeze(COMPATIBILITY_MATRIX)
 
 # Managed plugins (Bedrock-critical + Tier 1 infrastructure)
 MANAGED_PLUGINS = {
@@ -112,6 +125,7 @@ MANAGED_PLUGINS = {
     #     "critical": True
     # }
 }
+MANAGED_PLUGINS = _freeze(MANAGED_PLUGINS)
 
 # Legacy alias for backward compatibility
 BEDROCK_PLUGINS = MANAGED_PLUGINS
@@ -149,3 +163,4 @@ SERVERS = {
         ]
     }
 }
+SERVERS = _freeze(SERVERS)
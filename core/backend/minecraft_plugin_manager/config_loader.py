@@ -4,25 +4,66 @@ Configuration Loader
 Loads and validates configuration from YAML files.
 """
 
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml C parser/emitter; the pure-Python ones are several times slower
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    _LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    _LIBYAML = False
+
 from .config import MANAGED_PLUGINS, SERVERS
 
+
+class _ConfigDumper(SafeDumper):
+    """YAML dumper that can also write the read-only defaults from config.py"""
+
+
+_ConfigDumper.add_representer(MappingProxyType, lambda dumper, data: dumper.represent_dict(data))
+
 logger = logging.getLogger(__name__)
 
+_libyaml_warned = False
 
-def get_config_paths() -> list[Path]:
+# Fields each plugin source needs in its managed_plugins entry
+_REQUIRED_BY_SOURCE = {
+    'modrinth': frozenset({'project_id'}),
+    'geyser': frozenset({'project', 'artifact'}),
+}
+
+# Environment variable placeholder: ${VAR} or ${VAR:-default}
+_ENV_VAR_RE = re.compile(r'\$\{([A-Z_]+)(?::-([^}]*))?\}')
+
+# Parsed-config cache, kept in the user's own cache directory (never next to the config)
+CONFIG_CACHE_DIR = (Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+                    / "minecraft-plugin-manager")
+
+
+def get_config_paths() -> Tuple[Path, ...]:
     """
     Get list of config file paths to check in priority order
 
     Returns:
-        List of paths to check (first found wins)
+        Paths to check (first found wins)
     """
+    return _config_paths_for(os.getcwd())
+
+
+@functools.lru_cache(maxsize=4)
+def _config_paths_for(cwd: str) -> Tuple[Path, ...]:
+    """Build the config search paths for a working directory (cached per cwd)"""
     paths = []
 
     # 1. User config directory
@@ -30,15 +71,83 @@ def get_config_paths() -> list[Path]:
     paths.append(user_config)
 
     # 2. Current working directory
-    cwd_config = Path.cwd() / "config.yaml"
+    cwd_config = Path(cwd) / "config.yaml"
     paths.append(cwd_config)
 
     # 3. Project root (for development)
-    project_root = Path(__file__).parent.parent.parent.parent
+    project_root = Path(__file__).parents[3]
     project_config = project_root / "config.yaml"
     paths.append(project_config)
 
-    return paths
+    return tuple(paths)
+
+
+def _warn_if_no_libyaml():
+    """Warn (once per process) that YAML is parsed without the libyaml C extension"""
+    global _libyaml_warned
+    if not _LIBYAML and not _libyaml_warned:
+        logger.warning("PyYAML is running without libyaml - config parsing will be slower. "
+                       "Install libyaml-dev (or yaml-devel) and reinstall PyYAML to enable it.")
+        _libyaml_warned = True
+
+
+def _load_yaml_cached(path: Path) -> Tuple[object, bool]:
+    """
+    Parse a YAML file, reusing a cached parse result while the file is unchanged
+
+    The cache is JSON (loading it can't run code) in CONFIG_CACHE_DIR, one file
+    per config path, keyed by the file's mtime and size. It holds the raw parse
+    result, before environment variable substitution, so secrets from the
+    environment never reach disk. Documents JSON can't represent exactly (e.g.
+    dates or non-string keys) are simply not cached.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Tuple of (parsed YAML document, whether the raw text contains '${' placeholders)
+    """
+    path_digest = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()[:16]
+    cache_file = CONFIG_CACHE_DIR / f"config-{path_digest}.json"
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached.get('key') == key:
+            return cached['data'], cached['needs_subst']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing, stale format or corrupt - reparse
+
+    _warn_if_no_libyaml()
+
+    # Read in one go and let libyaml decode the bytes (no Python text layer)
+    raw = path.read_bytes()
+    data = yaml.load(raw, Loader=SafeLoader)
+    needs_subst = b'${' in raw
+
+    try:
+        payload = json.dumps({'key': key, 'data': data, 'needs_subst': needs_subst})
+    except (TypeError, ValueError):
+        return data, needs_subst  # Not JSON-representable - parse every time
+    if json.loads(payload)['data'] != data:
+        return data, needs_subst  # JSON would alter it (e.g. int keys become strings)
+
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        CONFIG_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+    return data, needs_subst
 
 
 def load_config(config_path: Optional[Path] = None) -> Dict:
@@ -51,9 +160,10 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
     Returns:
         Configuration dict with servers, managed_plugins, paths, etc.
     """
+    # Defaults are read-only and shared, not copied: user sections replace them wholesale below
     config = {
-        'servers': SERVERS.copy(),
-        'managed_plugins': MANAGED_PLUGINS.copy(),
+        'servers': SERVERS,
+        'managed_plugins': MANAGED_PLUGINS,
         'paths': {},
         'pterodactyl': {},
         'ssh': {},
@@ -74,7 +184,7 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
 
     loaded_from = None
     for path in config_files:
-        if path.exists():
+        if os.path.isfile(path):
             loaded_from = path
             break
 
@@ -85,15 +195,15 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
     logger.info(f"Loading configuration from: {loaded_from}")
 
     try:
-        with open(loaded_from, 'r') as f:
-            user_config = yaml.safe_load(f)
+        user_config, needs_subst = _load_yaml_cached(loaded_from)
 
         if not user_config:
             logger.warning(f"Config file {loaded_from} is empty")
             return config
 
-        # Process environment variable substitution
-        user_config = substitute_env_vars(user_config)
+        # Process environment variable substitution (skipped if the file has no placeholders)
+        if needs_subst:
+            user_config = substitute_env_vars(user_config)
 
         # Merge user config with defaults
         if 'servers' in user_config:
@@ -146,19 +256,25 @@ def substitute_env_vars(config: Dict) -> Dict:
     Returns:
         Config with environment variables substituted
     """
-    import re
+    # Look each variable up once per call (defaults differ per placeholder, so cache the raw value)
+    env_get = os.environ.get
+    env_cache = {}
+
+    def replacer(match):
+        var_name = match.group(1)
+        if var_name not in env_cache:
+            env_cache[var_name] = env_get(var_name)
+        env_value = env_cache[var_name]
+        if env_value is None:
+            return match.group(2) or ""
+        return env_value
 
     def substitute_value(value):
         if isinstance(value, str):
-            # Pattern: ${VAR} or ${VAR:-default}
-            pattern = r'\$\{([A-Z_]+)(?::-([^}]*))?\}'
-
-            def replacer(match):
-                var_name = match.group(1)
-                default_value = match.group(2) or ""
-                return os.environ.get(var_name, default_value)
-
-            return re.sub(pattern, replacer, value)
+            # Most values have no placeholders - skip the regex engine for those
+            if '${' not in value:
+                return value
+            return _ENV_VAR_RE.sub(replacer, value)
         elif isinstance(value, dict):
             return {k: substitute_value(v) for k, v in value.items()}
         elif isinstance(value, list):
@@ -188,6 +304,9 @@ def validate_config(config: Dict) -> tuple[bool, list[str]]:
     if 'managed_plugins' not in config or not config['managed_plugins']:
         errors.append("Config must define at least one plugin in 'managed_plugins' section")
 
+    # Names of the plugins this config defines (may differ from the defaults)
+    managed_plugin_names = frozenset(config.get('managed_plugins', {}))
+
     # Validate servers
     for server_name, server_config in config.get('servers', {}).items():
         if 'uuid' not in server_config:
@@ -196,12 +315,14 @@ def validate_config(config: Dict) -> tuple[bool, list[str]]:
         if 'platform' not in server_config:
             errors.append(f"Server '{server_name}' missing required 'platform' field")
 
-        if 'plugins' not in server_config or not isinstance(server_config['plugins'], list):
+        if not isinstance(server_config.get('plugins'), (list, tuple)):
             errors.append(f"Server '{server_name}' missing 'plugins' list")
 
         # Check all plugins exist
-        for plugin_name in server_config.get('plugins', []):
-            if plugin_name not in config.get('managed_plugins', {}):
+        plugins = server_config.get('plugins') or []
+        undefined = set(plugins) - managed_plugin_names
+        if undefined:
+            for plugin_name in dict.fromkeys(p for p in plugins if p in undefined):
                 errors.append(
                     f"Server '{server_name}' references undefined plugin '{plugin_name}'"
                 )
@@ -213,21 +334,12 @@ def validate_config(config: Dict) -> tuple[bool, list[str]]:
 
         source = plugin_config.get('source')
 
-        if source == 'modrinth' and 'project_id' not in plugin_config:
+        missing_fields = _REQUIRED_BY_SOURCE.get(source, frozenset()) - plugin_config.keys()
+        for field in sorted(missing_fields):
             errors.append(
-                f"Plugin '{plugin_name}' uses modrinth source but missing 'project_id'"
+                f"Plugin '{plugin_name}' uses {source} source but missing '{field}'"
             )
 
-        if source == 'geyser':
-            if 'project' not in plugin_config:
-                errors.append(
-                    f"Plugin '{plugin_name}' uses geyser source but missing 'project'"
-                )
-            if 'artifact' not in plugin_config:
-                errors.append(
-                    f"Plugin '{plugin_name}' uses geyser source but missing 'artifact'"
-                )
-
     # Validate Pterodactyl config (if present)
     if config.get('pterodactyl'):
         ptero = config['pterodactyl']
@@ -277,13 +389,20 @@ def save_config(config: Dict, config_path: Optional[Path] = None) -> bool:
     # Create directory if it doesn't exist
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Write to a sibling temp file and rename, so a crash never leaves a truncated config
+    tmp_path = config_path.with_name(f"{config_path.name}.tmp")
+
     try:
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        with open(tmp_path, 'w', buffering=1 << 16, encoding='utf-8') as f:
+            yaml.dump(config, f, Dumper=_ConfigDumper, default_flow_style=False, sort_keys=False,
+                      allow_unicode=True)
+        os.replace(tmp_path, config_path)
 
         logger.info(f"✓ Configuration saved to: {config_path}")
         return True
 
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
+        if tmp_path.exists():
+            tmp_path.unlink()
         return False
@@ -8,8 +8,12 @@ preflight checks, rollback, and infrastructure compatibility validation.
 import logging
 import os
 import re
+import shlex
+import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -26,12 +30,121 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+# Where Wings keeps server volumes on the node
+PTERODACTYL_VOLUMES_DIR = "/var/lib/pterodactyl/volumes"
+
+# OpenSSH connection multiplexing: the first ssh/scp call becomes the master and
+# later calls reuse its TCP connection instead of doing a full handshake each time
+SSH_CONTROL_PATH = Path.home() / ".ssh" / "mpm-%C"
+SSH_CONTROL_PERSIST = "10m"
+
+# Keepalive (seconds) so the shared connection survives idle gaps such as the post-restart wait
+SSH_KEEPALIVE_INTERVAL = 30
+
+# tar record size for JAR uploads: 1 MiB writes into the ssh pipe instead of tar's 10 KiB default
+TAR_RECORD_SIZE = 1 << 20
+TAR_BLOCKING_FACTOR = TAR_RECORD_SIZE // 512
+
+# Compressor for tar uploads when compression is enabled (fast level, all cores)
+DEPLOY_COMPRESS_PROGRAM = "zstd -1 -T0"
+DEPLOY_DECOMPRESS_PROGRAM = "zstd"
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Servers handled concurrently; stays below sshd's default MaxStartups (10)
+SSH_MAX_WORKERS = 8
+
+# Seconds a detected Velocity build number is reused before re-reading the proxy log
+VELOCITY_BUILD_CACHE_TTL = 60
+
+# Build suffix in the Velocity boot line, e.g. "git-a046f700-b557" (matched on raw ssh output)
+_VELOCITY_BUILD_RE = re.compile(rb'-b(\d+)')
+
+# Seconds to wait for deployed plugins to show up in a server's log
+VERIFY_TIMEOUT = 10
+
+# Remote shell snippet reporting whether the node can receive rsync uploads
+_RSYNC_PROBE = "command -v rsync >/dev/null 2>&1 && echo RSYNC=1 || echo RSYNC=0"
+
+# Characters with special meaning in a grep -E pattern
+_ERE_SPECIAL_RE = re.compile(r'([.^$*+?()\[\]{}|\\])')
+
 
 class DeploymentManager:
     """Manages plugin deployment operations"""
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, compress: bool = False,
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            dry_run: Preview mode - no actual changes
+            compress: Compress JAR uploads on the wire (worth it over slow/WAN links)
+            max_workers: Servers handled in parallel (default: SSH_MAX_WORKERS)
+        """
         self.dry_run = dry_run
+        self.max_workers = max_workers or SSH_MAX_WORKERS
+        # Compressing a loopback transfer only costs CPU
+        self.compress = compress and NODE_HOST not in _LOCAL_HOSTS
+        self._ssh_opts = [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={SSH_CONTROL_PATH}",
+            "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+            "-o", f"ServerAliveInterval={SSH_KEEPALIVE_INTERVAL}",
+            "-i", str(SSH_KEY),
+        ]
+        self._ssh_target = f"{NODE_USER}@{NODE_HOST}"
+        # Set once any ssh/rsync call may have started a master connection
+        self._ssh_used = False
+
+        # Remote paths per server, built once rather than on every call
+        self._paths = {
+            server_name: {
+                "plugins": f"{PTERODACTYL_VOLUMES_DIR}/{server_config['uuid']}/plugins",
+                "log": f"{PTERODACTYL_VOLUMES_DIR}/{server_config['uuid']}/logs/latest.log",
+            }
+            for server_name, server_config in SERVERS.items()
+        }
+
+        # (monotonic timestamp, build number) of the last successful Velocity lookup
+        self._velocity_build_cache: Optional[Tuple[float, int]] = None
+
+        # Inode of each server's latest.log before its last restart. The server rotates
+        # the log on startup, so until the inode changes the log is the pre-restart one.
+        self._pre_restart_log_inode: Dict[str, str] = {}
+
+        # Whether the node has rsync (None until checked by pre-flight or the first upload)
+        self._remote_rsync: Optional[bool] = None
+        self._remote_rsync_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the shared SSH master connection (if one is running)"""
+        if self.dry_run or not self._ssh_used:
+            return
+        self._ssh_used = False
+
+        try:
+            exit_cmd = ["ssh", *self._ssh_opts, "-O", "exit", self._ssh_target]
+            subprocess.run(exit_cmd, capture_output=True, timeout=5)
+        except Exception as e:
+            logger.debug(f"Could not close SSH master connection: {e}")
+
+    def _ssh_command(self, remote_cmd: str) -> List[str]:
+        """
+        Build the argv for running a command on the node (no local shell involved)
+
+        Args:
+            remote_cmd: Shell command to run on the node
+
+        Returns:
+            ssh argument list for subprocess
+        """
+        self._ssh_used = True
+        return ["ssh", *self._ssh_opts, self._ssh_target, remote_cmd]
 
     def run_preflight_checks(self) -> Tuple[bool, List[str]]:
         """
@@ -46,37 +159,43 @@ class DeploymentManager:
 
         issues = []
 
-        # Check 1: SSH connectivity
+        # Checks 1 & 2: SSH connectivity and node disk space, in one remote shell
         try:
-            test_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'echo ok'"
-            result = subprocess.run(test_cmd, shell=True, capture_output=True, text=True, timeout=5)
-            if "ok" in result.stdout:
-                logger.info("✓ SSH connectivity verified")
-            else:
-                issue = "✗ SSH connection failed - cannot connect to node"
-                issues.append(issue)
-                logger.error(issue)
+            check_cmd = self._ssh_command(
+                f"echo SSHOK; df -h {PTERODACTYL_VOLUMES_DIR} | tail -1; {_RSYNC_PROBE}"
+            )
+            result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=5)
+            lines = result.stdout.splitlines()
         except Exception as e:
             issue = f"✗ SSH connectivity check failed: {e}"
             issues.append(issue)
             logger.error(issue)
+            lines = None
 
-        # Check 2: Disk space on node
-        try:
-            df_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'df -h /var/lib/pterodactyl/volumes | tail -1'"
-            result = subprocess.run(df_cmd, shell=True, capture_output=True, text=True, timeout=5)
-            if result.stdout:
-                parts = result.stdout.split()
-                if len(parts) >= 5:
-                    usage_pct = parts[4].rstrip('%')
-                    if int(usage_pct) < 90:
-                        logger.info(f"✓ Disk space OK ({usage_pct}% used)")
-                    else:
-                        issue = f"⚠ Disk space warning: {usage_pct}% used (>90%)"
-                        issues.append(issue)
-                        logger.warning(issue)
-        except Exception as e:
-            logger.warning(f"⚠ Could not check disk space: {e}")
+        if lines is not None:
+            # Login banners/MOTDs may come first, so find the sentinel rather than expect line 0
+            sentinel = lines.index("SSHOK") if "SSHOK" in lines else None
+            if sentinel is not None:
+                logger.info("✓ SSH connectivity verified")
+                output = lines[sentinel + 1:]
+                self._remote_rsync = "RSYNC=1" in output
+
+                try:
+                    parts = output[0].split() if output else []
+                    if len(parts) >= 5:
+                        usage_pct = parts[4].rstrip('%')
+                        if int(usage_pct) < 90:
+                            logger.info(f"✓ Disk space OK ({usage_pct}% used)")
+                        else:
+                            issue = f"⚠ Disk space warning: {usage_pct}% used (>90%)"
+                            issues.append(issue)
+                            logger.warning(issue)
+                except Exception as e:
+                    logger.warning(f"⚠ Could not check disk space: {e}")
+            else:
+                issue = "✗ SSH connection failed - cannot connect to node"
+                issues.append(issue)
+                logger.error(issue)
 
         # Check 3: Download directory exists and is writable
         try:
@@ -116,52 +235,258 @@ class DeploymentManager:
         Returns:
             True if successful
         """
-        server_config = SERVERS[server_name]
-        server_uuid = server_config["uuid"]
+        return self.deploy_many(server_name, [(plugin_name, jar_path)])
+
+    def deploy_many(self, server_name: str, jars: List[Tuple[str, Path]]) -> bool:
+        """
+        Deploy several plugin JARs to a server in a single transfer
+
+        Uses rsync when available (JARs identical to the remote copy are skipped),
+        otherwise one tar-over-SSH stream. Either way existing JARs are backed up
+        and ownership/permissions fixed in the same remote session.
+
+        Args:
+            server_name: Target server name
+            jars: List of (plugin_name, local_jar_path) tuples
+
+        Returns:
+            True if successful
+        """
+        if not jars:
+            return True
 
-        # Construct remote paths
-        remote_plugins_dir = f"/var/lib/pterodactyl/volumes/{server_uuid}/plugins"
-        remote_jar_name = jar_path.name
-        remote_jar_path = f"{remote_plugins_dir}/{remote_jar_name}"
+        remote_plugins_dir = self._paths[server_name]["plugins"]
 
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-        backup_name = f"{remote_jar_name}.{timestamp}.BAK"
 
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would deploy {plugin_name} to {server_name}")
-            logger.info(f"[DRY RUN]   Source: {jar_path}")
-            logger.info(f"[DRY RUN]   Dest: {remote_jar_path}")
+            for plugin_name, jar_path in jars:
+                logger.info(f"[DRY RUN] Would deploy {plugin_name} to {server_name}")
+                logger.info(f"[DRY RUN]   Source: {jar_path}")
+                logger.info(f"[DRY RUN]   Dest: {remote_plugins_dir}/{jar_path.name}")
             return True
 
         try:
-            # Check if plugin already exists and create backup
-            check_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'test -f {remote_jar_path} && echo exists || echo new'"
-            result = subprocess.run(check_cmd, shell=True, capture_output=True, text=True, timeout=10)
-
-            if "exists" in result.stdout:
-                # Create backup of existing plugin
-                backup_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'cp {remote_jar_path} {remote_plugins_dir}/{backup_name}'"
-                subprocess.run(backup_cmd, shell=True, check=True, timeout=10)
+            # rsync needs to be on both ends, and --files-from takes names relative
+            # to one source directory
+            use_rsync = (shutil.which("rsync") is not None
+                         and len({jar_path.parent for _, jar_path in jars}) == 1
+                         and self._remote_has_rsync())
+            backups = None
+            if use_rsync:
+                try:
+                    backups = self._upload_rsync(remote_plugins_dir, jars, timestamp)
+                except subprocess.CalledProcessError as e:
+                    if e.returncode != 127:
+                        raise
+                    # rsync vanished from the node since it was checked - fall back to tar
+                    logger.warning(f"  ⚠ rsync not found on node, using tar for {server_name}")
+                    self._remote_rsync = False
+            if backups is None:
+                backups = self._upload_tar(remote_plugins_dir, jars, timestamp)
+
+            for backup_name in backups:
                 logger.info(f"  Backed up existing plugin: {backup_name}")
 
-            # Upload new JAR
-            scp_cmd = f"scp -i {SSH_KEY} {jar_path} {NODE_USER}@{NODE_HOST}:{remote_jar_path}"
-            subprocess.run(scp_cmd, shell=True, check=True, timeout=30)
-
-            # Set correct permissions
-            perms_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'chown 988:988 {remote_jar_path} && chmod 644 {remote_jar_path}'"
-            subprocess.run(perms_cmd, shell=True, check=True, timeout=10)
-
-            logger.info(f"  ✓ Deployed to {server_name}: {plugin_name}")
+            for plugin_name, _ in jars:
+                logger.info(f"  ✓ Deployed to {server_name}: {plugin_name}")
             return True
 
         except subprocess.TimeoutExpired:
-            logger.error(f"  ✗ Deployment timeout for {server_name}: {plugin_name}")
+            logger.error(f"  ✗ Deployment timeout for {server_name}")
             return False
         except subprocess.CalledProcessError as e:
-            logger.error(f"  ✗ Deployment failed for {server_name}: {plugin_name} - {e}")
+            logger.error(f"  ✗ Deployment failed for {server_name} - {e}")
             return False
 
+    def _remote_has_rsync(self) -> bool:
+        """Whether rsync is installed on the node (checked over SSH once, then cached)"""
+        with self._remote_rsync_lock:
+            if self._remote_rsync is None:
+                try:
+                    result = subprocess.run(self._ssh_command(_RSYNC_PROBE), capture_output=True,
+                                            text=True, timeout=10)
+                    self._remote_rsync = "RSYNC=1" in result.stdout.splitlines()
+                except (subprocess.SubprocessError, OSError) as e:
+                    logger.debug(f"Could not check for rsync on node: {e}")
+                    return False
+            return self._remote_rsync
+
+    def _upload_rsync(self, remote_plugins_dir: str, jars: List[Tuple[str, Path]],
+                      timestamp: str) -> List[str]:
+        """
+        Upload JARs with rsync, skipping any whose content already matches
+
+        Args:
+            remote_plugins_dir: Destination plugins directory on the node
+            jars: List of (plugin_name, local_jar_path) tuples, all in one directory
+            timestamp: Suffix timestamp for backups of replaced JARs
+
+        Returns:
+            Names of the backups created
+        """
+        source_dir = jars[0][1].parent
+        self._ssh_used = True
+        rsync_cmd = [
+            "rsync", "-a", "--checksum",
+            "--chown=988:988", "--chmod=F644",
+            "--backup", f"--suffix=.{timestamp}.BAK",
+            "--out-format=%i %n",
+            *(["--compress"] if self.compress else []),
+            "-e", shlex.join(["ssh", *self._ssh_opts]),
+            "--files-from=-",
+            f"{source_dir}/", f"{self._ssh_target}:{remote_plugins_dir}/",
+        ]
+        file_list = "\n".join(jar_path.name for _, jar_path in jars)
+        result = subprocess.run(rsync_cmd, input=file_list, capture_output=True, text=True,
+                                check=True, timeout=30 * len(jars))
+
+        # Itemized changes: '>f+++++++++' is a new file, anything else replaced (and backed up) one
+        backups = []
+        for line in result.stdout.splitlines():
+            flags, _, name = line.partition(" ")
+            if flags.startswith(">f") and not flags.endswith("+"):
+                backups.append(f"{name}.{timestamp}.BAK")
+        return backups
+
+    def _upload_tar(self, remote_plugins_dir: str, jars: List[Tuple[str, Path]],
+                    timestamp: str) -> List[str]:
+        """
+        Upload JARs as one tar stream piped through ssh
+
+        Args:
+            remote_plugins_dir: Destination plugins directory on the node
+            jars: List of (plugin_name, local_jar_path) tuples
+            timestamp: Suffix timestamp for backups of replaced JARs
+
+        Returns:
+            Names of the backups created
+        """
+        jar_names = " ".join(shlex.quote(jar_path.name) for _, jar_path in jars)
+        remote_tar_opts = f"-I {shlex.quote(DEPLOY_DECOMPRESS_PROGRAM)} " if self.compress else ""
+        remote_cmd = (
+            f"cd {shlex.quote(remote_plugins_dir)} && "
+            f"for f in {jar_names}; do "
+            f"if [ -f \"$f\" ]; then "
+            f"cp \"$f\" \"$f.{timestamp}.BAK\" || exit 1; "
+            f"echo \"BACKUP $f.{timestamp}.BAK\"; "
+            f"fi; "
+            f"done && "
+            f"tar {remote_tar_opts}-b {TAR_BLOCKING_FACTOR} -xf - && "
+            f"chown 988:988 {jar_names} && chmod 644 {jar_names}"
+        )
+
+        tar_cmd = ["tar", "-b", str(TAR_BLOCKING_FACTOR), "-cf", "-"]
+        if self.compress:
+            tar_cmd[1:1] = ["-I", DEPLOY_COMPRESS_PROGRAM]
+        for _, jar_path in jars:
+            tar_cmd += ["-C", str(jar_path.parent), jar_path.name]
+        ssh_cmd = self._ssh_command(remote_cmd)
+
+        tar = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, bufsize=TAR_RECORD_SIZE)
+        ssh = subprocess.Popen(ssh_cmd, stdin=tar.stdout, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+        tar.stdout.close()  # So tar gets SIGPIPE if ssh exits early
+
+        try:
+            stdout, stderr = ssh.communicate(timeout=30 * len(jars))
+        except subprocess.TimeoutExpired:
+            ssh.kill()
+            tar.kill()
+            ssh.communicate()
+            tar.wait()
+            raise
+
+        if tar.wait() != 0:
+            raise subprocess.CalledProcessError(tar.returncode, tar_cmd)
+        if ssh.returncode != 0:
+            raise subprocess.CalledProcessError(ssh.returncode, ssh_cmd, stdout, stderr)
+
+        return [line[len("BACKUP "):] for line in stdout.splitlines() if line.startswith("BACKUP ")]
+
+    def deploy_all(self, plan: Dict[str, List[Tuple[str, Path]]]) -> Dict[str, bool]:
+        """
+        Deploy to several servers concurrently (one deploy_many per server)
+
+        Args:
+            plan: Dict of {server_name: [(plugin_name, jar_path), ...]}
+
+        Stops starting new servers after the first failure; servers that were
+        never attempted are reported as None.
+
+        Returns:
+            Dict of {server_name: success (None if skipped)}, in plan order
+        """
+        return self._run_per_server(self.deploy_many,
+                                    {name: (jars,) for name, jars in plan.items()},
+                                    fail_fast=True)
+
+    def restart_all(self, server_names: List[str]) -> Dict[str, bool]:
+        """
+        Restart several servers concurrently
+
+        Args:
+            server_names: Servers to restart
+
+        Returns:
+            Dict of {server_name: success}, in the given order
+        """
+        return self._run_per_server(self.restart_server, {name: () for name in server_names})
+
+    def verify_all(self, deployments: Dict[str, List[str]],
+                   expected_versions: Dict[str, str],
+                   warn_missing: bool = True) -> Dict[str, Dict[str, bool]]:
+        """
+        Verify deployed plugins loaded, checking servers concurrently
+
+        Args:
+            deployments: Dict of {server_name: [plugin_name, ...]}
+            expected_versions: Dict of {plugin_name: expected_version}
+            warn_missing: Log a warning for each plugin that isn't verified
+
+        Returns:
+            Dict of {server_name: {plugin_name: verified}}
+        """
+        results = self._run_per_server(self._check_plugins_loaded,
+                                       {name: (plugins,) for name, plugins in deployments.items()})
+
+        # Log once everything is in, grouped by server rather than interleaved by thread
+        for server_name, verified in results.items():
+            self._log_verification(server_name, verified, warn_missing)
+        return results
+
+    def _run_per_server(self, func, args_by_server: Dict[str, tuple],
+                        fail_fast: bool = False) -> Dict:
+        """
+        Run func(server_name, *args) for each server on a bounded thread pool
+
+        With fail_fast, a falsy result stops servers that haven't started yet
+        from running (their result is None).
+        """
+        if not args_by_server:
+            return {}
+
+        stop = threading.Event()
+
+        def run(server_name: str, *args):
+            if stop.is_set():
+                return None  # An earlier server failed - don't start this one
+            result = func(server_name, *args)
+            if fail_fast and not result:
+                stop.set()
+            return result
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(args_by_server), self.max_workers)) as executor:
+            futures = {
+                executor.submit(run, server_name, *args): server_name
+                for server_name, args in args_by_server.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return {server_name: results[server_name] for server_name in args_by_server}
+
     def restart_server(self, server_name: str) -> bool:
         """
         Restart a server container via Docker
@@ -179,8 +504,17 @@ class DeploymentManager:
             return True
 
         try:
-            restart_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'docker restart $(docker ps --filter name={server_uuid} -q)'"
-            subprocess.run(restart_cmd, shell=True, check=True, timeout=30, capture_output=True)
+            # Note the current log's inode so verification can tell when the server has rotated it
+            log_path = shlex.quote(self._paths[server_name]["log"])
+            restart_cmd = self._ssh_command(
+                f"stat -c 'inode=%i' {log_path} 2>/dev/null; "
+                f"docker restart $(docker ps --filter name={server_uuid} -q)"
+            )
+            result = subprocess.run(restart_cmd, check=True, timeout=30, capture_output=True,
+                                    text=True)
+            first_line = result.stdout.split("\n", 1)[0]
+            if first_line.startswith("inode="):
+                self._pre_restart_log_inode[server_name] = first_line[len("inode="):]
             logger.info(f"  ✓ Restarted {server_name}")
             return True
 
@@ -203,31 +537,89 @@ class DeploymentManager:
         Returns:
             True if verified
         """
-        server_uuid = SERVERS[server_name]["uuid"]
-        log_path = f"/var/lib/pterodactyl/volumes/{server_uuid}/logs/latest.log"
+        return self.verify_plugins_loaded(server_name, [plugin_name])[plugin_name]
 
-        if self.dry_run:
-            logger.info(f"[DRY RUN] Would verify {plugin_name} loaded on {server_name}")
-            return True
+    def verify_plugins_loaded(self, server_name: str, plugin_names: List[str],
+                              warn_missing: bool = True) -> Dict[str, bool]:
+        """
+        Verify several plugins loaded on a server with a single log grep
 
-        try:
-            # Wait a moment for plugin to load
-            time.sleep(3)
+        Lines from the log as it was before the last restart_server() don't count.
 
-            # Check latest log for plugin loading
-            check_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} \"grep -i 'loaded plugin.*{plugin_name.lower()}' {log_path} | tail -1\""
-            result = subprocess.run(check_cmd, shell=True, capture_output=True, text=True, timeout=10)
+        Args:
+            server_name: Server to check
+            plugin_names: Plugins to verify
+            warn_missing: Log a warning for each plugin that isn't verified
 
-            if result.stdout and plugin_name.lower() in result.stdout.lower():
+        Returns:
+            Dict of {plugin_name: verified}
+        """
+        results = self._check_plugins_loaded(server_name, plugin_names)
+        self._log_verification(server_name, results, warn_missing)
+        return results
+
+    def _log_verification(self, server_name: str, results: Dict[str, bool], warn_missing: bool):
+        """Log the outcome of _check_plugins_loaded for one server"""
+        for plugin_name, verified in results.items():
+            if self.dry_run:
+                logger.info(f"[DRY RUN] Would verify {plugin_name} loaded on {server_name}")
+            elif verified:
                 logger.info(f"  ✓ Verified {plugin_name} loaded on {server_name}")
-                return True
-            else:
+            elif warn_missing:
                 logger.warning(f"  ⚠ Could not verify {plugin_name} on {server_name}")
-                return False
+
+    def _check_plugins_loaded(self, server_name: str, plugin_names: List[str]) -> Dict[str, bool]:
+        """Grep the server log for plugin_names (see verify_plugins_loaded) without logging"""
+        log_path = self._paths[server_name]["log"]
+
+        if self.dry_run:
+            return {plugin_name: True for plugin_name in plugin_names}
+
+        results = {plugin_name: False for plugin_name in plugin_names}
+
+        # Re-grep the log on the node until every plugin shows up or the timeout
+        # passes, waking on log writes (inotifywait) where available
+        pattern = "|".join(_ERE_SPECIAL_RE.sub(r"\\\1", plugin_name.lower())
+                           for plugin_name in plugin_names)
+        grep_pattern = shlex.quote(f"loaded plugin.*({pattern})")
+        quoted_log = shlex.quote(log_path)
+        names = " ".join(shlex.quote(plugin_name.lower()) for plugin_name in plugin_names)
+        old_inode = shlex.quote(self._pre_restart_log_inode.get(server_name, ""))
+        script = (
+            f"end=$((SECONDS + {VERIFY_TIMEOUT}))\n"
+            "while :; do\n"
+            "  out=\n"
+            f"  if [ \"$(stat -c %i {quoted_log} 2>/dev/null)\" != {old_inode} ]; then\n"
+            f"    out=$(grep -iE {grep_pattern} {quoted_log} 2>/dev/null)\n"
+            "  fi\n"
+            "  missing=0\n"
+            f"  for p in {names}; do\n"
+            "    printf '%s\\n' \"$out\" | grep -qiF -- \"$p\" || missing=1\n"
+            "  done\n"
+            "  if [ $missing -eq 0 ] || [ $SECONDS -ge $end ]; then break; fi\n"
+            "  if command -v inotifywait >/dev/null; then\n"
+            f"    inotifywait -qq -t 1 -e modify {quoted_log} 2>/dev/null || sleep 0.2\n"
+            "  else\n"
+            "    sleep 0.5\n"
+            "  fi\n"
+            "done\n"
+            "printf '%s\\n' \"$out\"\n"
+        )
+
+        try:
+            check_cmd = self._ssh_command("bash -s")
+            result = subprocess.run(check_cmd, input=script, capture_output=True, text=True,
+                                    timeout=VERIFY_TIMEOUT + 10)
+            log_lines = result.stdout.lower().splitlines()
+
+            for plugin_name in plugin_names:
+                name = plugin_name.lower()
+                results[plugin_name] = any(name in line for line in log_lines)
 
         except Exception as e:
-            logger.warning(f"  ⚠ Verification failed for {plugin_name} on {server_name}: {e}")
-            return False
+            logger.warning(f"  ⚠ Verification failed on {server_name}: {e}")
+
+        return results
 
     def rollback_deployment(self) -> bool:
         """
@@ -246,36 +638,44 @@ class DeploymentManager:
 
         rollback_success = {}
 
-        for server_name, server_config in SERVERS.items():
-            server_uuid = server_config["uuid"]
-            plugins_dir = f"/var/lib/pterodactyl/volumes/{server_uuid}/plugins"
+        for server_name, paths in self._paths.items():
+            plugins_dir = paths["plugins"]
 
             logger.info(f"\n{server_name}:")
 
             try:
                 # Find all .BAK files
-                find_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'find {plugins_dir} -name \"*.BAK\" -type f | sort -r'"
-                result = subprocess.run(find_cmd, shell=True, capture_output=True, text=True, timeout=10)
+                find_cmd = self._ssh_command(f"find {plugins_dir} -name '*.BAK' -type f | sort -r")
+                result = subprocess.run(find_cmd, capture_output=True, text=True, timeout=10)
 
                 if not result.stdout:
-                    logger.warning(f"  No .BAK files found - nothing to rollback")
+                    logger.warning("  No .BAK files found - nothing to rollback")
                     continue
 
                 backup_files = result.stdout.strip().split('\n')
 
-                for backup_file in backup_files[:10]:  # Limit to 10 most recent
-                    # Extract original filename (remove timestamp and .BAK)
-                    original = backup_file.rsplit('.', 2)[0] + '.jar'
-
-                    # Restore backup
-                    restore_cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} 'cp {backup_file} {original}'"
-                    subprocess.run(restore_cmd, shell=True, check=True, timeout=10)
-
-                    logger.info(f"  ✓ Restored: {os.path.basename(original)}")
-
-                    if server_name not in rollback_success:
-                        rollback_success[server_name] = []
-                    rollback_success[server_name].append(os.path.basename(original))
+                # Keep only the newest backup per plugin JAR. Backups are named
+                # <jar>.<timestamp>.BAK and find output is reverse-sorted, so the
+                # first one seen for each original is the most recent.
+                latest: Dict[str, str] = {}
+                for backup_file in backup_files:
+                    original = backup_file.rsplit('.', 2)[0]
+                    latest.setdefault(original, backup_file)
+
+                restores = list(latest.items())[:10]  # Limit to 10 plugins
+
+                # Restore all backups through one remote shell
+                script = "\n".join(
+                    f"cp {shlex.quote(backup_file)} {shlex.quote(original)}"
+                    for original, backup_file in restores
+                )
+                restore_cmd = self._ssh_command("bash -se")
+                subprocess.run(restore_cmd, input=script, text=True, check=True, timeout=30)
+
+                restored = [os.path.basename(original) for original, _ in restores]
+                for name in restored:
+                    logger.info(f"  ✓ Restored: {name}")
+                rollback_success[server_name] = restored
 
             except Exception as e:
                 logger.error(f"  ✗ Rollback failed for {server_name}: {e}")
@@ -304,6 +704,11 @@ class DeploymentManager:
         Returns:
             Build number or None if not found
         """
+        if self._velocity_build_cache:
+            cached_at, build_number = self._velocity_build_cache
+            if time.monotonic() - cached_at < VELOCITY_BUILD_CACHE_TTL:
+                return build_number
+
         proxy_server = None
         for server_name, config in SERVERS.items():
             if config["platform"] == "velocity":
@@ -314,23 +719,24 @@ class DeploymentManager:
             logger.warning("No Velocity server found in configuration")
             return None
 
-        server_uuid = SERVERS[proxy_server]["uuid"]
-        log_path = f"/var/lib/pterodactyl/volumes/{server_uuid}/logs/latest.log"
+        log_path = self._paths[proxy_server]["log"]
 
         try:
             # Extract Velocity version from logs
-            cmd = f"ssh -i {SSH_KEY} {NODE_USER}@{NODE_HOST} \"grep 'Booting up Velocity' {log_path} | tail -1\""
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
+            cmd = self._ssh_command(f"grep 'Booting up Velocity' {log_path} | tail -1")
+            result = subprocess.run(cmd, capture_output=True, timeout=10)
 
             if result.stdout:
                 # Parse build number from output like: "git-a046f700-b557"
-                match = re.search(r'-b(\d+)', result.stdout)
+                match = _VELOCITY_BUILD_RE.search(result.stdout)
                 if match:
                     build_number = int(match.group(1))
                     logger.info(f"Detected Velocity build: {build_number}")
+                    self._velocity_build_cache = (time.monotonic(), build_number)
                     return build_number
                 else:
-                    logger.warning(f"Could not parse Velocity build number from: {result.stdout}")
+                    logger.warning(f"Could not parse Velocity build number from: "
+                                   f"{result.stdout.decode('utf-8', 'replace')}")
 
         except Exception as e:
             logger.warning(f"Failed to check Velocity version: {e}")
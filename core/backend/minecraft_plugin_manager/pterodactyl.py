@@ -4,14 +4,55 @@ Pterodactyl API Client
 Handles communication with Pterodactyl panel for server discovery and management.
 """
 
+import json
 import logging
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # Optional: pip install minecraft-plugin-manager[orjson]
+except ImportError:
+    orjson = None
+
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# JSON decoder for API responses (orjson if installed)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Server list pages fetched concurrently after the first one
+PAGE_FETCH_MAX_WORKERS = 8
+
+# ETag-validated GET responses kept per client (least recently used evicted first)
+RESPONSE_CACHE_SIZE = 128
+
+# Name patterns checked in priority order by detect_platform
+_NAME_PLATFORM_PATTERNS = (
+    (re.compile(r'velocity|proxy'), 'velocity'),
+    (re.compile(r'paper'), 'paper'),
+    (re.compile(r'spigot'), 'spigot'),
+    (re.compile(r'lobby|game|respack'), 'paper'),  # These are typically Paper servers
+)
+
+# Startup command patterns; 'proxy' is not matched here since JVM flags like
+# -Dhttps.proxyHost appear in non-proxy startup commands
+_STARTUP_PLATFORM_PATTERNS = (
+    (re.compile(r'velocity'), 'velocity'),
+    (re.compile(r'paper'), 'paper'),
+    (re.compile(r'spigot'), 'spigot'),
+)
+
+# Version patterns like "1.20.1" or "velocity-3.4.0"
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)')
+
+# Server names containing any of these are treated as Minecraft servers
+_MC_KEYWORDS_RE = re.compile(r'minecraft|mc|proxy|lobby|game|velocity|paper|spigot')
+
 
 class PterodactylClient:
     """Client for Pterodactyl Panel API"""
@@ -38,8 +79,17 @@ class PterodactylClient:
         self.session.headers.update({
             'Authorization': f'Bearer {api_key}',
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json'
         })
+        # Enough pooled connections for the concurrent page fetches in list_servers
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # {(endpoint, params): {'etag': ..., 'body': ...}} for conditional re-fetches
+        self._cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -60,11 +110,34 @@ class PterodactylClient:
 
         url = f"{self.panel_url}{base_path}{endpoint}"
 
+        cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached:
+                self._cache.move_to_end(cache_key)
+
+        headers = {'If-None-Match': cached['etag']} if cached else None
+
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
+
+            # Unchanged since last fetch - reuse the parsed body
+            if cached and response.status_code == 304:
+                return cached['body']
+
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            body = _loads(response.content)
+
+            etag = response.headers.get('ETag')
+            if etag:
+                with self._cache_lock:
+                    self._cache[cache_key] = {'etag': etag, 'body': body}
+                    self._cache.move_to_end(cache_key)
+                    if len(self._cache) > RESPONSE_CACHE_SIZE:
+                        self._cache.popitem(last=False)
+
+            return body
+        except (requests.RequestException, ValueError) as e:  # ValueError: bad JSON body
             logger.error(f"API request failed: {e}")
             raise
 
@@ -79,44 +152,72 @@ class PterodactylClient:
 
         Returns:
             List of server information dicts
+
+        Raises:
+            RuntimeError: If the listing, or any of its pages, could not be fetched
         """
         logger.info("Fetching servers from Pterodactyl panel...")
 
-        servers = []
-        page = 1
-
-        while True:
-            try:
-                data = self._get('/servers', params={'page': page})
-
-                for server in data.get('data', []):
-                    attributes = server.get('attributes', {})
-
-                    # Apply filters
-                    if filter_tag:
-                        tags = attributes.get('tags', [])
-                        if filter_tag not in tags:
-                            continue
-
-                    if filter_node:
-                        node = attributes.get('node', '')
-                        if node != filter_node:
-                            continue
+        try:
+            first_page = self._get('/servers', params={'page': 1})
+        except Exception as e:
+            # Returning [] here would be indistinguishable from "no servers"
+            raise RuntimeError(f"Could not fetch server list: {e}") from e
+
+        pages = {1: first_page}
+
+        # The first page tells us how many there are - fetch the rest concurrently
+        pagination = first_page.get('meta', {}).get('pagination', {})
+        total_pages = pagination.get('total_pages', 1) or 1
+
+        if total_pages > 1:
+            workers = min(total_pages - 1, PAGE_FETCH_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._get, '/servers', {'page': page}): page
+                    for page in range(2, total_pages + 1)
+                }
+                for future in as_completed(futures):
+                    page = futures[future]
+                    try:
+                        pages[page] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch servers page {page}, will retry: {e}")
+
+            # Retry failed pages once, one at a time (off the concurrent burst)
+            for page in range(2, total_pages + 1):
+                if page not in pages:
+                    try:
+                        pages[page] = self._get('/servers', params={'page': page})
+                    except Exception as e:
+                        logger.error(f"Failed to fetch servers page {page}: {e}")
+
+        # A partial list would make discovery silently drop servers
+        missing_pages = [page for page in range(1, total_pages + 1) if page not in pages]
+        if missing_pages:
+            raise RuntimeError(
+                f"Incomplete server list: page(s) {', '.join(map(str, missing_pages))} "
+                f"of {total_pages} could not be fetched"
+            )
 
-                    servers.append(attributes)
+        servers = []
 
-                # Check if there are more pages
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+        for page in sorted(pages):
+            for server in pages[page].get('data', []):
+                attributes = server.get('attributes', {})
 
-                if pagination.get('current_page') >= pagination.get('total_pages', 0):
-                    break
+                # Apply filters
+                if filter_tag:
+                    tags = attributes.get('tags', [])
+                    if filter_tag not in tags:
+                        continue
 
-                page += 1
+                if filter_node:
+                    node = attributes.get('node', '')
+                    if node != filter_node:
+                        continue
 
-            except Exception as e:
-                logger.error(f"Failed to fetch servers page {page}: {e}")
-                break
+                servers.append(attributes)
 
         logger.info(f"Found {len(servers)} server(s)")
         return servers
@@ -153,25 +254,16 @@ class PterodactylClient:
         # Try to detect from server name
         name = server.get('name', '').lower()
 
-        if 'velocity' in name or 'proxy' in name:
-            return 'velocity'
-        elif 'paper' in name:
-            return 'paper'
-        elif 'spigot' in name:
-            return 'spigot'
-        elif 'lobby' in name or 'game' in name or 'respack' in name:
-            # These are typically Paper servers
-            return 'paper'
+        for pattern, platform in _NAME_PLATFORM_PATTERNS:
+            if pattern.search(name):
+                return platform
 
         # Try to detect from startup command if available
-        startup = server.get('container', {}).get('startup_command', '')
+        startup = server.get('container', {}).get('startup_command', '').lower()
 
-        if 'velocity' in startup.lower():
-            return 'velocity'
-        elif 'paper' in startup.lower():
-            return 'paper'
-        elif 'spigot' in startup.lower():
-            return 'spigot'
+        for pattern, platform in _STARTUP_PLATFORM_PATTERNS:
+            if pattern.search(startup):
+                return platform
 
         # Default to paper for generic Minecraft servers
         logger.warning(f"Could not detect platform for {server.get('name')}, defaulting to 'paper'")
@@ -191,8 +283,7 @@ class PterodactylClient:
         description = server.get('description', '')
 
         # Look for version patterns like "1.20.1" or "velocity-3.4.0"
-        version_pattern = r'(\d+\.\d+\.\d+)'
-        match = re.search(version_pattern, description)
+        match = _VERSION_RE.search(description)
 
         if match:
             return match.group(1)
@@ -233,7 +324,7 @@ class PterodactylClient:
             server_name = server.get('name', '').lower().replace(' ', '-')
 
             # Skip if not a Minecraft server
-            if not any(keyword in server_name for keyword in ['minecraft', 'mc', 'proxy', 'lobby', 'game', 'velocity', 'paper', 'spigot']):
+            if not _MC_KEYWORDS_RE.search(server_name):
                 logger.debug(f"Skipping non-Minecraft server: {server_name}")
                 continue
 
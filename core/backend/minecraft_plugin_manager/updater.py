@@ -4,12 +4,29 @@ Main Update Orchestrator
 Coordinates plugin update workflow across API clients and deployment.
 """
 
+import itertools
 import json
 import logging
+import os
 import subprocess
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson  # Optional: pip install minecraft-plugin-manager[orjson]
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: pip install minecraft-plugin-manager[ijson]
+except ImportError:
+    ijson = None
 
 from .config import (
     MANAGED_PLUGINS,
@@ -24,21 +41,90 @@ from .api_clients import (
     ModrinthAPIClient,
     GeyserAPIClient,
     PluginDownloader,
+    check_updates_batch,
 )
 from .deployment import DeploymentManager
 
 logger = logging.getLogger(__name__)
 
+# JSON codec for the manifest and deployment state (orjson if installed)
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, obj):
+    """
+    Write obj as JSON via a sibling temp file and rename, so readers never see a partial file
+
+    Args:
+        path: Destination file
+        obj: JSON-serializable object
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(_dumps(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class _ThreadLogBuffer(logging.Filter):
+    """Logger filter that holds back records logged by the thread that created it"""
+
+    def __init__(self):
+        super().__init__()
+        self.thread_id = threading.get_ident()
+        self.records: List[logging.LogRecord] = []
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.thread == self.thread_id:
+            self.records.append(record)
+            return False
+        return True
+
+
+# Concurrent JAR downloads (kept low to stay polite to Modrinth/Geyser)
+DOWNLOAD_MAX_WORKERS = 4
+
+# Audit-trail commit message for commit_to_git()
+COMMIT_MESSAGE_TEMPLATE = """Automated deployment: {count} plugin(s) updated
+
+{changes}
+
+Deployed by: minecraft-plugin-manager
+Timestamp: {timestamp}
+
+🤖 Generated with Claude Code
+
+Co-Authored-By: Claude <noreply@anthropic.com>"""
+
+# Post-restart readiness polling: give up after READY_TIMEOUT seconds, backing off
+# from READY_POLL_INTERVAL up to READY_POLL_MAX_INTERVAL between rounds
+READY_TIMEOUT = 120
+READY_POLL_INTERVAL = 2
+READY_POLL_MAX_INTERVAL = 15
+
 
 class MinecraftPluginUpdater:
     """Main plugin updater orchestrator"""
 
-    def __init__(self, dry_run: bool = False, force: bool = False, config: Optional[Dict] = None):
+    def __init__(self, dry_run: bool = False, force: bool = False, config: Optional[Dict] = None,
+                 jobs: Optional[int] = None):
         """
         Args:
             dry_run: Preview mode - no actual changes
             force: Include SNAPSHOT/dev versions
             config: Optional configuration dict (from config.yaml)
+            jobs: Max servers to deploy/restart/verify in parallel
         """
         self.dry_run = dry_run
         self.force = force
@@ -48,15 +134,25 @@ class MinecraftPluginUpdater:
         self.servers = self.config.get('servers', SERVERS)
         self.managed_plugins = self.config.get('managed_plugins', MANAGED_PLUGINS)
 
-        self.manifest = self.load_manifest()
-        self.deployment_state = self.load_deployment_state()
+        # {platform: [server_name, ...]} in configured server order
+        self._servers_by_platform: Dict[str, List[str]] = {}
+        for server_name, server_config in self.servers.items():
+            self._servers_by_platform.setdefault(server_config["platform"], []).append(server_name)
+
         self.updates_available = {}
 
+        # (plugin names, future of _run_deployment_checks) from start_deployment_checks()
+        self._deployment_checks: Optional[Tuple[frozenset, Future]] = None
+
         # Initialize components
         self.modrinth_client = ModrinthAPIClient(force_snapshots=force)
         self.geyser_client = GeyserAPIClient()
-        self.downloader = PluginDownloader(dry_run=dry_run)
-        self.deployer = DeploymentManager(dry_run=dry_run)
+        self.downloader = PluginDownloader(dry_run=dry_run, force=force)
+        self.deployer = DeploymentManager(
+            dry_run=dry_run,
+            compress=self.config.get('ssh', {}).get('compress_deploy', False),
+            max_workers=jobs,
+        )
 
     def load_manifest(self) -> dict:
         """Load shared-plugins.json manifest"""
@@ -64,8 +160,56 @@ class MinecraftPluginUpdater:
             logger.error(f"Manifest file not found: {MANIFEST_FILE}")
             return {}
 
-        with open(MANIFEST_FILE) as f:
-            return json.load(f)
+        return _loads(MANIFEST_FILE.read_bytes())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Wait out any background deployment checks, then release the deployer's SSH master"""
+        self._discard_deployment_checks()
+        self.deployer.close()
+
+    @cached_property
+    def manifest(self) -> dict:
+        """Shared plugins manifest, loaded on first access"""
+        return self.load_manifest()
+
+    @cached_property
+    def deployment_state(self) -> dict:
+        """Deployment state, loaded on first access"""
+        return self.load_deployment_state()
+
+    def _stream_deployment_state(self) -> bool:
+        """Whether read-only callers should stream deployment-state.json instead of loading it"""
+        return (ijson is not None
+                and 'deployment_state' not in self.__dict__
+                and DEPLOYMENT_STATE_FILE.exists())
+
+    def _iter_server_states(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Iterate (server_name, server_state) pairs from the deployment state
+
+        Streams the "servers" object with ijson when available, so only one
+        server's state is materialized at a time; otherwise uses the loaded state.
+        """
+        if not self._stream_deployment_state():
+            yield from self.deployment_state.get("servers", {}).items()
+            return
+
+        with open(DEPLOYMENT_STATE_FILE, 'rb') as f:
+            yield from ijson.kvitems(f, 'servers', use_float=True)
+
+    def _deployment_state_value(self, key: str, default=None):
+        """Read a single top-level value from the deployment state (streamed when possible)"""
+        if not self._stream_deployment_state():
+            return self.deployment_state.get(key, default)
+
+        with open(DEPLOYMENT_STATE_FILE, 'rb') as f:
+            return next(ijson.items(f, key, use_float=True), default)
 
     def load_deployment_state(self) -> dict:
         """Load deployment-state.json"""
@@ -73,8 +217,7 @@ class MinecraftPluginUpdater:
             logger.warning(f"Deployment state file not found: {DEPLOYMENT_STATE_FILE}")
             return {}
 
-        with open(DEPLOYMENT_STATE_FILE) as f:
-            return json.load(f)
+        return _loads(DEPLOYMENT_STATE_FILE.read_bytes())
 
     def save_manifest(self):
         """Save updated manifest"""
@@ -82,8 +225,10 @@ class MinecraftPluginUpdater:
             logger.info("[DRY RUN] Would save manifest to: %s", MANIFEST_FILE)
             return
 
-        with open(MANIFEST_FILE, 'w') as f:
-            json.dump(self.manifest, f, indent=2)
+        if 'manifest' not in self.__dict__:
+            return  # Never loaded, so nothing changed
+
+        _write_json_atomic(MANIFEST_FILE, self.manifest)
         logger.info("Manifest saved: %s", MANIFEST_FILE)
 
     def save_deployment_state(self):
@@ -92,8 +237,10 @@ class MinecraftPluginUpdater:
             logger.info("[DRY RUN] Would save deployment state to: %s", DEPLOYMENT_STATE_FILE)
             return
 
-        with open(DEPLOYMENT_STATE_FILE, 'w') as f:
-            json.dump(self.deployment_state, f, indent=2)
+        if 'deployment_state' not in self.__dict__:
+            return  # Never loaded, so nothing changed
+
+        _write_json_atomic(DEPLOYMENT_STATE_FILE, self.deployment_state)
         logger.info("Deployment state saved: %s", DEPLOYMENT_STATE_FILE)
 
     def check_for_updates(self) -> Dict[str, Dict]:
@@ -109,43 +256,54 @@ class MinecraftPluginUpdater:
 
         updates = {}
 
+        # Get current versions from manifest
+        current_versions = {}
+        for plugin_name in self.managed_plugins:
+            if plugin_name in self.manifest.get("plugins", {}):
+                current_versions[plugin_name] = self.manifest["plugins"][plugin_name].get("version")
+
+        # Fetch latest versions for all plugins concurrently
+        latest_infos = check_updates_batch(
+            {name: config for name, config in self.managed_plugins.items()
+             if current_versions.get(name)},
+            self.modrinth_client,
+            self.geyser_client,
+        )
+
         for plugin_name, config in self.managed_plugins.items():
             logger.info(f"\nChecking: {plugin_name}")
 
-            # Get current version from manifest
-            current_version = None
-            if plugin_name in self.manifest.get("plugins", {}):
-                current_version = self.manifest["plugins"][plugin_name].get("version")
+            current_version = current_versions.get(plugin_name)
 
             if not current_version:
-                logger.warning(f"  No current version found in manifest")
+                logger.warning("  No current version found in manifest")
                 continue
 
             logger.info(f"  Current version: {current_version}")
 
-            # Check for latest version based on source
-            latest_info = None
-            if config["source"] == "modrinth":
-                latest_info = self.modrinth_client.check_updates(config["project_id"])
-            elif config["source"] == "geyser":
-                latest_info = self.geyser_client.check_updates(config["project"], config["artifact"])
-            else:
+            if plugin_name not in latest_infos:
                 logger.warning(f"  Unknown source: {config['source']}")
                 continue
 
+            latest_info = latest_infos[plugin_name]
+
             if not latest_info:
-                logger.warning(f"  Could not fetch latest version")
+                logger.warning("  Could not fetch latest version")
                 continue
 
             latest_version = latest_info["version"]
             logger.info(f"  Latest version: {latest_version}")
 
-            # Normalize versions for comparison
-            current_normalized = self.downloader.normalize_version(current_version)
-            latest_normalized = self.downloader.normalize_version(latest_version)
+            # Compare versions (identical strings - the usual case - need no normalizing)
+            if self.force:
+                update_available = True
+            elif current_version == latest_version:
+                update_available = False
+            else:
+                update_available = (self.downloader.normalize_version(current_version)
+                                    != self.downloader.normalize_version(latest_version))
 
-            # Compare versions
-            if current_normalized != latest_normalized or self.force:
+            if update_available:
                 logger.info(f"  → Update available: {current_version} → {latest_version}")
                 updates[plugin_name] = {
                     "current": current_version,
@@ -153,7 +311,7 @@ class MinecraftPluginUpdater:
                     "info": latest_info
                 }
             else:
-                logger.info(f"  ✓ Already up to date")
+                logger.info("  ✓ Already up to date")
 
         self.updates_available = updates
         return updates
@@ -172,31 +330,105 @@ class MinecraftPluginUpdater:
         logger.info("Downloading updates...")
         logger.info("=" * 70 + "\n")
 
-        downloads = {}
+        results = {}
+        if not updates:
+            return results
+
+        # Downloads are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_MAX_WORKERS, len(updates))) as executor:
+            futures = {}
+            for plugin_name, update_info in updates.items():
+                logger.info(f"Downloading: {plugin_name}")
+
+                info = update_info["info"]
+                future = executor.submit(
+                    self.downloader.download,
+                    download_url=info["download_url"],
+                    filename=info["filename"],
+                    expected_hash=info.get("hash"),
+                    hash_type=info.get("hash_type", "sha256")
+                )
+                futures[future] = plugin_name
+
+            for future in as_completed(futures):
+                plugin_name = futures[future]
+                try:
+                    download_path = future.result()
+                except Exception as e:
+                    logger.error(f"Download error for {plugin_name}: {e}")
+                    download_path = None
+
+                if download_path:
+                    results[plugin_name] = download_path
+                    logger.info(f"✓ {plugin_name} downloaded successfully\n")
+                else:
+                    logger.error(f"✗ Failed to download {plugin_name}\n")
+
+        # One hash cache write for the whole batch
+        self.downloader.save_hash_cache()
 
-        for plugin_name, update_info in updates.items():
-            logger.info(f"Downloading: {plugin_name}")
+        # Keep the original update order for deployment
+        downloads = {name: results[name] for name in updates if name in results}
 
-            info = update_info["info"]
-            download_url = info["download_url"]
-            filename = info["filename"]
-            expected_hash = info.get("hash")
-            hash_type = info.get("hash_type", "sha256")
+        return downloads
 
-            download_path = self.downloader.download(
-                download_url=download_url,
-                filename=filename,
-                expected_hash=expected_hash,
-                hash_type=hash_type
-            )
+    def start_deployment_checks(self, plugin_names: List[str]):
+        """
+        Start the pre-flight and compatibility checks in the background
 
-            if download_path:
-                downloads[plugin_name] = download_path
-                logger.info(f"✓ {plugin_name} downloaded successfully\n")
-            else:
-                logger.error(f"✗ Failed to download {plugin_name}\n")
+        Both are independent of the downloads, so callers can start them first and
+        let their SSH round-trips overlap the transfers. deploy_all_updates() waits
+        for the results (or runs the checks itself if they weren't started).
 
-        return downloads
+        Args:
+            plugin_names: Plugins that are about to be deployed
+        """
+        self._discard_deployment_checks()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._run_deployment_checks, list(plugin_names))
+        executor.shutdown(wait=False)
+        self._deployment_checks = (frozenset(plugin_names), future)
+
+    def _discard_deployment_checks(self):
+        """Cancel background deployment checks, or wait for them if already running"""
+        if self._deployment_checks is None:
+            return
+
+        _, future = self._deployment_checks
+        self._deployment_checks = None
+        if not future.cancel():
+            try:
+                future.result()  # Don't leave SSH calls running behind the caller's back
+            except Exception as e:
+                logger.debug(f"Discarded deployment checks failed: {e}")
+
+    def _run_deployment_checks(self, plugin_names: List[str]) -> Tuple[Tuple[bool, List[str]],
+                                                                       Tuple[bool, List[str]],
+                                                                       List[logging.LogRecord]]:
+        """
+        Run the pre-flight then the compatibility check, holding back their log output
+
+        The deployer's log records from this thread are buffered rather than emitted,
+        so checks running during downloads don't interleave with download progress.
+
+        Args:
+            plugin_names: Plugins that are about to be deployed
+
+        Returns:
+            Tuple of (pre-flight result, compatibility result, buffered log records)
+        """
+        buffer = _ThreadLogBuffer()
+        deployer_logger = logging.getLogger(DeploymentManager.__module__)
+        deployer_logger.addFilter(buffer)
+        try:
+            preflight = self.deployer.run_preflight_checks()
+            # Compatibility only matters if pre-flight passed (deployment aborts otherwise)
+            compat = (self.deployer.check_infrastructure_compatibility(plugin_names)
+                      if preflight[0] else (True, []))
+        finally:
+            deployer_logger.removeFilter(buffer)
+        return preflight, compat, buffer.records
 
     def deploy_all_updates(self, downloads: Dict[str, Path]) -> bool:
         """
@@ -208,17 +440,29 @@ class MinecraftPluginUpdater:
         Returns:
             True if successful
         """
-        # Pre-flight safety checks
-        preflight_ok, preflight_issues = self.deployer.run_preflight_checks()
+        # Pre-flight safety and infrastructure compatibility checks, reusing the ones
+        # started alongside the downloads when they covered these plugins
+        plugins_to_deploy = list(downloads.keys())
+        checks = self._deployment_checks
+        if checks is not None and checks[0] == frozenset(plugins_to_deploy):
+            self._deployment_checks = None
+            preflight, compat, records = checks[1].result()
+        else:
+            self._discard_deployment_checks()
+            preflight, compat, records = self._run_deployment_checks(plugins_to_deploy)
+
+        # Emit the checks' output now, in one piece
+        for record in records:
+            logging.getLogger(record.name).handle(record)
+
+        preflight_ok, preflight_issues = preflight
         if not preflight_ok:
             logger.error("\n✗ Deployment aborted due to pre-flight check failures")
             for issue in preflight_issues:
                 logger.error(f"  {issue}")
             return False
 
-        # Infrastructure compatibility check
-        plugins_to_deploy = list(downloads.keys())
-        compatible, compat_issues = self.deployer.check_infrastructure_compatibility(plugins_to_deploy)
+        compatible, compat_issues = compat
 
         if not compatible:
             logger.error("\n✗ Deployment aborted due to infrastructure compatibility issues")
@@ -230,77 +474,134 @@ class MinecraftPluginUpdater:
         logger.info("Deploying updates to servers...")
         logger.info("=" * 70 + "\n")
 
-        deployment_success = {}
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Deploy each plugin to its target servers
+        # Group the downloads by target server so each server gets one batched upload
+        deploy_plan: Dict[str, List[Tuple[str, Path]]] = {}
         for plugin_name, jar_path in downloads.items():
             plugin_config = self.managed_plugins[plugin_name]
-            platforms = plugin_config["platforms"]
-
-            logger.info(f"Deploying: {plugin_name}")
 
-            # Find servers that need this plugin
-            target_servers = []
-            for server_name, server_config in self.servers.items():
-                if server_config["platform"] in platforms:
-                    target_servers.append(server_name)
+            # Find servers that need this plugin (each server has one platform, so
+            # de-duplicating the platforms keeps every server listed once)
+            target_servers = [
+                server_name
+                for platform in dict.fromkeys(plugin_config["platforms"])
+                for server_name in self._servers_by_platform.get(platform, ())
+            ]
 
-            # Deploy to each target server
-            success_count = 0
+            logger.info(f"Deploying: {plugin_name} ({len(target_servers)} server(s))")
             for server_name in target_servers:
-                if self.deployer.deploy_to_server(server_name, plugin_name, jar_path):
-                    success_count += 1
-
-                    # Track deployment in state
-                    if server_name not in deployment_success:
-                        deployment_success[server_name] = []
-                    deployment_success[server_name].append(plugin_name)
+                deploy_plan.setdefault(server_name, []).append((plugin_name, jar_path))
+
+        # Deploy each server's plugins in a single transfer, servers in parallel
+        deploy_results = self.deployer.deploy_all(deploy_plan)
+        failed = [server_name for server_name, ok in deploy_results.items() if ok is False]
+        if failed:
+            logger.error(f"  ✗ Deployment failed on: {', '.join(failed)}")
+            skipped = [server_name for server_name, ok in deploy_results.items() if ok is None]
+            if skipped:
+                logger.error(f"  Not attempted: {', '.join(skipped)}")
+            logger.error("")
+            return False
 
-            if success_count == len(target_servers):
-                logger.info(f"  ✓ {plugin_name} deployed to all {success_count} servers\n")
-            else:
-                logger.error(f"  ✗ {plugin_name} only deployed to {success_count}/{len(target_servers)} servers\n")
-                return False
+        # Track deployment in state
+        deployment_success = {
+            server_name: [plugin_name for plugin_name, _ in jars]
+            for server_name, jars in deploy_plan.items()
+        }
 
         # Restart all affected servers
         logger.info("\nRestarting servers...")
-        for server_name in deployment_success.keys():
-            if not self.deployer.restart_server(server_name):
+        restart_results = self.deployer.restart_all(list(deployment_success))
+        for server_name, ok in restart_results.items():
+            if not ok:
                 logger.error(f"Failed to restart {server_name}")
                 return False
 
         # Wait for servers to start and verify plugin loading
+        unverified: Dict[str, List[str]] = {}
         if not self.dry_run:
-            logger.info("\nWaiting 30 seconds for servers to start...")
-            import time
-            time.sleep(30)
+            logger.info("\nWaiting for servers to start and load plugins...")
+            unverified = self._wait_for_servers_ready(deployment_success)
 
-            logger.info("\nVerifying plugin loading...")
-            for server_name, plugins in deployment_success.items():
-                logger.info(f"\n{server_name}:")
-                for plugin_name in plugins:
-                    latest_version = self.updates_available[plugin_name]["latest"]
-                    self.deployer.verify_plugin_loaded(server_name, plugin_name, latest_version)
-
-        # Update deployment state
+        # Update deployment state (the JARs are on the servers either way, so record them,
+        # flagging any that weren't verified as loaded)
         if not self.dry_run:
-            self.update_deployment_state(deployment_success, timestamp)
+            self.update_deployment_state(deployment_success, timestamp, unverified)
 
             # Commit to git for audit trail
             logger.info("\nCommitting changes to git...")
-            self.commit_to_git(deployment_success)
+            self.commit_to_git(deployment_success, timestamp, unverified)
+
+        if unverified:
+            logger.error("\n✗ Some deployed plugins were not verified as loaded - "
+                         "check the server logs")
+            return False
 
         return True
 
-    def update_deployment_state(self, deployments: Dict[str, List[str]], timestamp: str):
+    def _wait_for_servers_ready(self, deployments: Dict[str, List[str]],
+                                timeout: float = READY_TIMEOUT,
+                                interval: float = READY_POLL_INTERVAL) -> Dict[str, List[str]]:
+        """
+        Poll restarted servers until every deployed plugin has loaded
+
+        Each round re-checks only the plugins not yet seen (all servers in
+        parallel), backing off exponentially between rounds.
+
+        Args:
+            deployments: Dict of {server_name: [plugin_names]}
+            timeout: Seconds to keep polling before giving up
+            interval: Initial delay between rounds
+
+        Returns:
+            Dict of {server_name: [plugin_names]} not verified before the timeout
+            (empty if every plugin loaded)
+        """
+        expected_versions = {
+            plugin_name: self.updates_available[plugin_name]["latest"]
+            for plugins in deployments.values()
+            for plugin_name in plugins
+        }
+        pending = {server_name: list(plugins)
+                   for server_name, plugins in deployments.items() if plugins}
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while pending:
+            results = self.deployer.verify_all(pending, expected_versions, warn_missing=False)
+            for server_name, verified in results.items():
+                pending[server_name] = [plugin_name for plugin_name in pending[server_name]
+                                        if not verified.get(plugin_name)]
+                if not pending[server_name]:
+                    del pending[server_name]
+                    logger.info(f"  ✓ {server_name} ready after {time.monotonic() - started:.0f}s")
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, READY_POLL_MAX_INTERVAL)
+
+        for server_name, plugins in pending.items():
+            for plugin_name in plugins:
+                logger.warning(f"  ⚠ Could not verify {plugin_name} on {server_name} "
+                               f"within {timeout:.0f}s")
+
+        return pending
+
+    def update_deployment_state(self, deployments: Dict[str, List[str]], timestamp: str,
+                                unverified: Optional[Dict[str, List[str]]] = None):
         """
         Update deployment-state.json with new deployment info
 
         Args:
             deployments: Dict of {server_name: [plugin_names]}
             timestamp: ISO timestamp
+            unverified: Dict of {server_name: [plugin_names]} deployed but not
+                verified as loaded
         """
+        unverified = unverified or {}
         logger.info("\nUpdating deployment state...")
 
         for server_name, plugins in deployments.items():
@@ -321,9 +622,14 @@ class MinecraftPluginUpdater:
                 if "deployed_plugins" not in server_state:
                     server_state["deployed_plugins"] = {}
 
-                # Calculate SHA256 of deployed JAR
+                # SHA256 of deployed JAR (already computed during download when possible)
                 jar_path = DOWNLOADS_DIR / update_info["info"]["filename"]
-                sha256 = self.downloader.calculate_hash(jar_path, "sha256") if jar_path.exists() else "unknown"
+                sha256 = self.downloader.sha256_by_path.get(jar_path)
+                if sha256 is None:
+                    if jar_path.exists():
+                        sha256 = self.downloader.calculate_hash(jar_path, "sha256")
+                    else:
+                        sha256 = "unknown"
 
                 server_state["deployed_plugins"][plugin_name] = {
                     "version": latest_version,
@@ -333,6 +639,11 @@ class MinecraftPluginUpdater:
                     "previous_version": current_version,
                     "note": "Automated deployment"
                 }
+                if plugin_name in unverified.get(server_name, ()):
+                    server_state["deployed_plugins"][plugin_name]["verified"] = False
+                    server_state["deployed_plugins"][plugin_name]["note"] = (
+                        "Automated deployment - not verified as loaded"
+                    )
 
         # Update last_updated timestamp
         self.deployment_state["last_updated"] = timestamp
@@ -341,12 +652,16 @@ class MinecraftPluginUpdater:
         self.save_deployment_state()
         logger.info("✓ Deployment state updated")
 
-    def commit_to_git(self, deployment_info: Dict) -> bool:
+    def commit_to_git(self, deployment_info: Dict, timestamp: Optional[str] = None,
+                      unverified: Optional[Dict[str, List[str]]] = None) -> bool:
         """
         Commit deployment changes to git for audit trail
 
         Args:
             deployment_info: Dict of {server_name: [plugin_names]}
+            timestamp: ISO timestamp of the deployment (defaults to now)
+            unverified: Dict of {server_name: [plugin_names]} deployed but not
+                verified as loaded (flagged in the commit message)
 
         Returns:
             True if successful
@@ -355,28 +670,25 @@ class MinecraftPluginUpdater:
             logger.info("[DRY RUN] Would commit changes to git")
             return True
 
+        git = ["git", "-C", str(BASE_DIR)]
+        state_file = "checksums/deployment-state.json"
+
         try:
-            # Change to base directory for git operations
-            import os
-            original_dir = os.getcwd()
-            os.chdir(BASE_DIR)
-
-            # Check if we're in a git repository
-            check_git = subprocess.run("git rev-parse --git-dir", shell=True, capture_output=True, timeout=5)
-            if check_git.returncode != 0:
+            # Check the state file for changes (also fails if BASE_DIR isn't a git repository).
+            # Limited to that path so git doesn't scan the whole work tree for untracked files.
+            status = subprocess.run(git + ["status", "--porcelain", "--", state_file],
+                                    capture_output=True, text=True, timeout=5)
+            if status.returncode != 0:
                 logger.warning("Not in a git repository - skipping git commit")
-                os.chdir(original_dir)
                 return False
 
-            # Check if there are changes to commit
-            status = subprocess.run("git status --porcelain", shell=True, capture_output=True, text=True, timeout=5)
             if not status.stdout:
                 logger.info("No git changes to commit")
-                os.chdir(original_dir)
                 return True
 
             # Stage deployment-state.json
-            subprocess.run("git add checksums/deployment-state.json", shell=True, check=True, timeout=5)
+            subprocess.run(git + ["add", "--", state_file], check=True, timeout=5,
+                           capture_output=True, text=True)
 
             # Create commit message
             plugins_updated = []
@@ -384,38 +696,34 @@ class MinecraftPluginUpdater:
                 for plugin_name in plugins:
                     if plugin_name in self.updates_available:
                         update = self.updates_available[plugin_name]
-                        plugins_updated.append(f"{plugin_name}: {update['current']} → {update['latest']}")
-
-            commit_msg = f"""Automated deployment: {len(plugins_updated)} plugin(s) updated
-
-{chr(10).join([f"- {p}" for p in plugins_updated])}
-
-Deployed by: minecraft-plugin-manager
-Timestamp: {datetime.now(timezone.utc).isoformat()}
-
-🤖 Generated with Claude Code
-
-Co-Authored-By: Claude <noreply@anthropic.com>"""
+                        change = f"{plugin_name}: {update['current']} → {update['latest']}"
+                        if plugin_name in (unverified or {}).get(server_name, ()):
+                            change += f" (NOT VERIFIED as loaded on {server_name})"
+                        plugins_updated.append(change)
+
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc).isoformat()
+            commit_msg = COMMIT_MESSAGE_TEMPLATE.format(
+                count=len(plugins_updated),
+                changes="\n".join(f"- {p}" for p in plugins_updated),
+                timestamp=timestamp,
+            )
 
-            # Create commit
-            commit_cmd = f"git commit -m '{commit_msg}'"
-            subprocess.run(commit_cmd, shell=True, check=True, timeout=10)
+            # Create commit (message on stdin, so quotes in it need no escaping)
+            subprocess.run(git + ["commit", "-F", "-"], input=commit_msg, text=True, check=True,
+                           timeout=10, capture_output=True)
 
             logger.info("✓ Changes committed to git")
-            os.chdir(original_dir)
             return True
 
         except subprocess.CalledProcessError as e:
             logger.warning(f"⚠ Git commit failed: {e}")
+            if e.stderr:
+                logger.warning(f"  {e.stderr.strip()}")
             return False
         except Exception as e:
             logger.warning(f"⚠ Git integration error: {e}")
             return False
-        finally:
-            try:
-                os.chdir(original_dir)
-            except:
-                pass
 
     def show_status(self):
         """Display current plugin versions from deployment state"""
@@ -423,41 +731,52 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         logger.info("Current Plugin Deployment Status")
         logger.info("=" * 70 + "\n")
 
-        if not self.deployment_state.get("servers"):
+        server_states = self._iter_server_states()
+        first_server = next(server_states, None)
+        if first_server is None:
             logger.warning("No deployment state found")
             return
 
-        last_updated = self.deployment_state.get("last_updated", "unknown")
+        # Everything below is INFO output - skip building it when that's filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        last_updated = self._deployment_state_value("last_updated", "unknown")
         logger.info(f"Last Updated: {last_updated}\n")
 
-        for server_name, server_info in self.deployment_state["servers"].items():
-            logger.info(f"{server_name}:")
-            logger.info(f"  Platform: {server_info.get('platform', 'unknown')}")
-            logger.info(f"  UUID: {server_info.get('uuid', 'unknown')}")
+        managed_plugins = self.managed_plugins
+
+        for server_name, server_info in itertools.chain([first_server], server_states):
+            # One log record per server rather than one per line
+            lines = [
+                f"{server_name}:",
+                f"  Platform: {server_info.get('platform', 'unknown')}",
+                f"  UUID: {server_info.get('uuid', 'unknown')}",
+            ]
 
             if "infrastructure" in server_info:
-                logger.info("  Infrastructure:")
+                lines.append("  Infrastructure:")
                 for infra_name, infra_info in server_info["infrastructure"].items():
                     version = infra_info.get("version", "unknown")
                     deployed_at = infra_info.get("deployed_at", "unknown")
-                    logger.info(f"    {infra_name}: {version} (deployed: {deployed_at})")
+                    lines.append(f"    {infra_name}: {version} (deployed: {deployed_at})")
 
             if "deployed_plugins" in server_info:
-                logger.info("  Plugins:")
+                lines.append("  Plugins:")
                 for plugin_name, plugin_info in sorted(server_info["deployed_plugins"].items()):
                     version = plugin_info.get("version", "unknown")
 
                     # Check if this plugin is managed by the tool
-                    is_managed = plugin_name in self.managed_plugins
+                    is_managed = plugin_name in managed_plugins
                     managed_marker = "🔧" if is_managed else "  "
 
-                    logger.info(f"    {managed_marker} {plugin_name}: {version}")
+                    lines.append(f"    {managed_marker} {plugin_name}: {version}")
 
-            logger.info("")
+            lines.append("")
+            logger.info("\n".join(lines))
 
         # Summary of managed plugins
-        managed_count = len([p for p in self.managed_plugins.keys()])
-        logger.info(f"Managed Plugins: {managed_count}")
+        logger.info(f"Managed Plugins: {len(managed_plugins)}")
         logger.info("  🔧 = Managed by this tool\n")
 
     def check_version_consistency(self) -> Dict[str, List[Dict]]:
@@ -473,56 +792,44 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
 
         inconsistencies = {}
 
-        # Group servers by platform type
-        platforms = {}
-        for server_name, server_config in self.servers.items():
-            platform = server_config["platform"]
-            if platform not in platforms:
-                platforms[platform] = []
-            platforms[platform].append(server_name)
+        # Deployed plugins of the configured servers (state streamed one server at a time)
+        deployed_by_server = {
+            server_name: server_state.get("deployed_plugins", {})
+            for server_name, server_state in self._iter_server_states()
+            if server_name in self.servers
+        }
 
         # Check each platform group
-        for platform, server_list in platforms.items():
+        for platform, server_list in self._servers_by_platform.items():
             if len(server_list) < 2:
                 logger.info(f"\nPlatform '{platform}': Only 1 server, skipping consistency check")
                 continue
 
             logger.info(f"\nPlatform '{platform}': Checking {len(server_list)} servers")
 
-            # Get deployed plugins for each server in this platform
-            server_plugins = {}
+            # One pass over each server's deployed plugins: {plugin_name: {server_name: version}}
+            per_plugin = defaultdict(dict)
             for server_name in server_list:
-                if server_name in self.deployment_state.get("servers", {}):
-                    deployed = self.deployment_state["servers"][server_name].get("deployed_plugins", {})
-                    server_plugins[server_name] = deployed
-                else:
+                if server_name not in deployed_by_server:
                     logger.warning(f"  {server_name}: No deployment state found")
-                    server_plugins[server_name] = {}
-
-            # Find all unique plugins across servers in this platform
-            all_plugins = set()
-            for plugins in server_plugins.values():
-                all_plugins.update(plugins.keys())
+                    continue
+                for plugin_name, plugin_info in deployed_by_server[server_name].items():
+                    per_plugin[plugin_name][server_name] = plugin_info.get("version", "unknown")
 
             # Check each plugin for version consistency
-            for plugin_name in sorted(all_plugins):
-                versions = {}
-                for server_name in server_list:
-                    if plugin_name in server_plugins[server_name]:
-                        version = server_plugins[server_name][plugin_name].get("version", "unknown")
-                        versions[server_name] = version
-                    else:
-                        versions[server_name] = None
+            for plugin_name in sorted(per_plugin):
+                installed = per_plugin[plugin_name]
+                versions = {server_name: installed.get(server_name) for server_name in server_list}
 
                 # Check if all versions match
                 unique_versions = set(v for v in versions.values() if v is not None)
 
                 if len(unique_versions) > 1:
                     # Version mismatch found
-                    logger.warning(f"  ⚠ DRIFT DETECTED: {plugin_name}")
-                    for server_name, version in versions.items():
-                        status = "NOT INSTALLED" if version is None else version
-                        logger.warning(f"    {server_name}: {status}")
+                    logger.warning("\n".join([f"  ⚠ DRIFT DETECTED: {plugin_name}"] + [
+                        f"    {server_name}: {'NOT INSTALLED' if version is None else version}"
+                        for server_name, version in versions.items()
+                    ]))
 
                     if plugin_name not in inconsistencies:
                         inconsistencies[plugin_name] = []
@@ -538,9 +845,10 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
                     missing_servers = [s for s, v in versions.items() if v is None]
                     installed_version = list(unique_versions)[0] if unique_versions else "unknown"
 
-                    logger.warning(f"  ⚠ MISSING: {plugin_name} (installed: {installed_version})")
-                    for server_name in missing_servers:
-                        logger.warning(f"    {server_name}: NOT INSTALLED")
+                    logger.warning("\n".join(
+                        [f"  ⚠ MISSING: {plugin_name} (installed: {installed_version})"]
+                        + [f"    {server_name}: NOT INSTALLED" for server_name in missing_servers]
+                    ))
 
                     if plugin_name not in inconsistencies:
                         inconsistencies[plugin_name] = []
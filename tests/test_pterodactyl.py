@@ -0,0 +1,28 @@
+"""Tests for Pterodactyl server platform detection"""
+
+from minecraft_plugin_manager.pterodactyl import PterodactylClient
+
+
+def _server(name, startup=''):
+    return {'name': name, 'container': {'startup_command': startup}}
+
+
+def test_detect_platform_from_name():
+    client = PterodactylClient('https://panel.example.com', 'key')
+    assert client.detect_platform(_server('Velocity Proxy')) == 'velocity'
+    assert client.detect_platform(_server('Lobby')) == 'paper'
+
+
+def test_detect_platform_ignores_proxy_jvm_flags_in_startup():
+    client = PterodactylClient('https://panel.example.com', 'key')
+    server = _server(
+        'Survival SMP',
+        'java -Xms128M -Dhttps.proxyHost=10.0.0.1 -jar paper.jar',
+    )
+    assert client.detect_platform(server) == 'paper'
+
+
+def test_detect_platform_from_startup_velocity():
+    client = PterodactylClient('https://panel.example.com', 'key')
+    server = _server('Survival SMP', 'java -Xms128M -jar velocity.jar')
+    assert client.detect_platform(server) == 'velocity'